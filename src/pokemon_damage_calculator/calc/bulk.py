@@ -0,0 +1,99 @@
+"""
+Raw stats for many species and spreads at once, with numpy (the `numpy` extra).
+
+Stat vectors have a last axis of length 6 in `Stat` order, HP first. The
+arithmetic is the same float64 operations as `stat_tables.raw_stat`, so the
+results match `Pokemon.raw_stat` exactly.
+"""
+
+from functools import cache
+from typing import Iterable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.bulk needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator.calc.stat_tables import NATURE_MULTIPLIERS, nature_index
+from pokemon_damage_calculator import data
+from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.model.models import (
+    NatureModel,
+    Species,
+    StatDistribution,
+)
+
+type Spread = tuple[StatDistribution, StatDistribution, NatureModel]
+"""(EVs, IVs, nature)"""
+
+_IS_HP = np.array([stat is Stat.HP for stat in Stat])
+
+
+def stat_vector(distribution: StatDistribution) -> np.ndarray:
+    return np.array([distribution[stat] for stat in Stat], dtype=np.int64)
+
+
+def nature_vector(nature: NatureModel) -> np.ndarray:
+    return np.array(
+        [NATURE_MULTIPLIERS[nature_index(nature, stat)] for stat in Stat],
+        dtype=np.float64,
+    )
+
+
+def raw_stats(base, evs, ivs, level, nature_multipliers) -> np.ndarray:
+    """All arguments broadcast against each other."""
+    base = np.asarray(base, dtype=np.int64)
+    evs = np.asarray(evs, dtype=np.int64)
+    ivs = np.asarray(ivs, dtype=np.int64)
+    level = np.asarray(level, dtype=np.int64)
+    points = np.floor((2 * base + ivs + evs // 4) * level / 100)
+    hp = points + level + 10
+    other = np.floor((points + 5) * np.asarray(nature_multipliers, dtype=np.float64))
+    return np.where(_IS_HP, hp, other).astype(np.int64)
+
+
+def base_stats(species: Iterable[Species]) -> np.ndarray:
+    """(species, 6) array of base stats."""
+    return np.array(
+        [[s.baseStats[stat] for stat in Stat] for s in species], dtype=np.int64
+    ).reshape(-1, len(Stat))
+
+
+@cache
+def _pokedex_base_stats() -> np.ndarray:
+    result = base_stats(data._species_list())
+    result.flags.writeable = False
+    return result
+
+
+def spread_arrays(
+    spreads: Sequence[Spread],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(spreads, 6) arrays of EVs, IVs and nature multipliers."""
+    evs = np.array([stat_vector(e) for e, _, _ in spreads]).reshape(-1, len(Stat))
+    ivs = np.array([stat_vector(i) for _, i, _ in spreads]).reshape(-1, len(Stat))
+    natures = np.array([nature_vector(n) for _, _, n in spreads]).reshape(-1, len(Stat))
+    return evs, ivs, natures
+
+
+def pokedex_stats(
+    spreads: Sequence[Spread],
+    level: int = 50,
+    species: Optional[Iterable[Species]] = None,
+) -> np.ndarray:
+    """
+    (spreads, species, 6) array of raw stats. Species default to the whole
+    pokedex, in pokedex.json order.
+    """
+    base = _pokedex_base_stats() if species is None else base_stats(species)
+    evs, ivs, natures = spread_arrays(spreads)
+    return raw_stats(
+        base[None, :, :],
+        evs[:, None, :],
+        ivs[:, None, :],
+        level,
+        natures[:, None, :],
+    )
@@ -0,0 +1,183 @@
+"""
+A bounded LRU cache of calc results, opted into with `Format.calc_cache`.
+
+Results are keyed by `fingerprint`, the inputs of a calc as plain values: the
+attacker's and defender's species, spreads, nature, ability, item, level,
+boosts, status and HP, the move, the auras of every Pokemon on the field (which
+may include ones switched out), the field and the format. Two calcs with the
+same fingerprint give the same rolls, however their Pokemon and moves were
+built, so a sweep over many matchups with few distinct ones skips the repeats.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import sys
+from threading import Lock
+from typing import Callable, Hashable, Optional, TYPE_CHECKING
+
+from pokemon_damage_calculator.calc.pokemon import Pokemon
+from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.model.logic import calc_auras
+from pokemon_damage_calculator.model.models import Move, StatDistribution
+
+if TYPE_CHECKING:
+    from pokemon_damage_calculator.calc.calcbuilder import GameState
+
+_STATS = list(Stat)
+
+
+def _spread(distribution: StatDistribution) -> tuple[int, ...]:
+    return tuple(distribution[stat] for stat in _STATS)
+
+
+def pokemon_fingerprint(pokemon: Pokemon) -> tuple:
+    """The calc inputs of `pokemon`."""
+    species = pokemon.species
+    return (
+        species.name,
+        tuple(species.types),
+        _spread(species.baseStats),
+        _spread(pokemon.evs),
+        _spread(pokemon.ivs),
+        pokemon.nature.name,
+        pokemon.ability,
+        pokemon.item,
+        pokemon.level,
+        _spread(pokemon.boosts),
+        pokemon.status,
+        pokemon.current_hp,
+    )
+
+
+def move_fingerprint(move: Move) -> tuple:
+    return (
+        move.num,
+        move.name,
+        move.basePower,
+        move.type,
+        move.category,
+        move.flags,
+        move.features,
+    )
+
+
+def fingerprint(game_state: "GameState", move: Move) -> tuple:
+    """The inputs of `game_state.calc(move)`."""
+    format = game_state.format
+    return (
+        pokemon_fingerprint(game_state.attacker),
+        pokemon_fingerprint(game_state.defender),
+        move_fingerprint(move),
+        calc_auras(game_state),
+        game_state.weather,
+        game_state.terrain,
+        format._gen,
+        format._doubles,
+    )
+
+
+def _sizeof(value: object) -> int:
+    """Approximate bytes held by `value`, counting into tuples and lists."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(_sizeof(item) for item in value)
+    return size
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CalcCache:
+    """
+    Rolls by fingerprint, least recently used first out once there are more
+    than `max_entries` entries or they take more than about `max_bytes`. A limit
+    of None is no limit. It is safe to share between threads.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 4096, max_bytes: Optional[int] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[tuple[int, ...], int]] = (
+            OrderedDict()
+        )
+        """fingerprint -> (rolls, approximate size of the entry)"""
+        self._nbytes = 0
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the keys and rolls."""
+        return self._nbytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return CacheStats(
+                self._stats.hits, self._stats.misses, self._stats.evictions
+            )
+
+    def clear(self) -> None:
+        """Drops every entry and zeroes the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[list[int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+        return list(entry[0])
+
+    def put(self, key: Hashable, rolls: list[int]) -> None:
+        value = tuple(rolls)
+        size = _sizeof(key) + _sizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self._nbytes += size
+            while self._entries and self._over_limit():
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+                self._stats.evictions += 1
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._nbytes > self.max_bytes
+
+    def calc(
+        self,
+        game_state: "GameState",
+        move: Move,
+        compute: Callable[[], list[int]],
+    ) -> list[int]:
+        """The cached rolls of `move` in `game_state`, from `compute` on a miss."""
+        key = fingerprint(game_state, move)
+        rolls = self.get(key)
+        if rolls is None:
+            rolls = compute()
+            self.put(key, rolls)
+        return rolls
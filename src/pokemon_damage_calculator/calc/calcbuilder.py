@@ -1,20 +1,33 @@
-from typing import Optional
-from pokemon_damage_calculator.calc.damage_calc import damage_calc
+from itertools import count
+from typing import Iterable, Optional, TYPE_CHECKING
+from pokemon_damage_calculator.calc.calc_cache import CalcCache, fingerprint
+from pokemon_damage_calculator.calc.damage_calc import (
+    CalcPlan,
+    damage_calc,
+    damage_calc_many,
+)
+from pokemon_damage_calculator.calc.damage_result import DamageResult
 from pokemon_damage_calculator.calc.pokemon import (
     IntoPokemon,
     Pokemon,
+    PokemonBuilder,
     into_pokemon,
 )
 from pokemon_damage_calculator.calc.speed_queue import SpeedQueue
-from pokemon_damage_calculator.data import IntoMove, into_move
+from pokemon_damage_calculator.data import Dataset, IntoMove, IntoSpecies, get_dataset
 from pokemon_damage_calculator.model.enums import Terrain, Weather
 from pokemon_damage_calculator.model.logic import enters_effects
 
+if TYPE_CHECKING:
+    from pokemon_damage_calculator.calc.distribution import DamageDistribution
+
 
 class Format:
     def __init__(self, gen: int, doubles: bool) -> None:
         self._gen = gen
         self._doubles = doubles
+        self._numpy_rolls = False
+        self._calc_cache: Optional[CalcCache] = None
 
     @staticmethod
     def gen9vgc() -> "Format":
@@ -24,17 +37,63 @@ class Format:
         self._doubles = doubles
         return self
 
+    def numpy_rolls(self, numpy_rolls: bool = True) -> "Format":
+        """Compute damage rolls with numpy (calc.rolls), raises ImportError without it."""
+        if numpy_rolls:
+            from pokemon_damage_calculator.calc import rolls  # noqa: F401
+        self._numpy_rolls = numpy_rolls
+        return self
+
+    def calc_cache(
+        self, max_entries: Optional[int] = 4096, max_bytes: Optional[int] = None
+    ) -> "Format":
+        """
+        Remember calc results in a bounded LRU cache (calc.calc_cache), see
+        `cache` for its counters. Both limits None turns it off.
+        """
+        if max_entries is None and max_bytes is None:
+            self._calc_cache = None
+        else:
+            self._calc_cache = CalcCache(max_entries, max_bytes)
+        return self
+
+    @property
+    def cache(self) -> Optional[CalcCache]:
+        return self._calc_cache
+
+    @property
+    def dataset(self) -> Dataset:
+        return get_dataset(self._gen)
+
+    def builder(self, species: IntoSpecies) -> PokemonBuilder:
+        """A PokemonBuilder for `species` as it is in this format's generation."""
+        return PokemonBuilder(self.dataset.into_species(species))
+
+    def plan(self, attacker: IntoPokemon, move: IntoMove) -> CalcPlan:
+        """A CalcPlan of `move` by `attacker` in this format, to run against many targets."""
+        return CalcPlan(into_pokemon(attacker), self.dataset.into_move(move), self)
+
     def game(self, attacker: IntoPokemon, defender: IntoPokemon) -> "GameState":
         return GameState(self, attacker, defender)
 
 
+_field_versions = count()
+
+
 class GameState:
+    """
+    `field_version` changes whenever the weather or terrain is set, so values
+    derived from the field (e.g. cached effective stats) can tell they are stale.
+    It is unique across game states.
+    """
+
     def __init__(
         self,
         format: Format,
         attacker: Optional[IntoPokemon],
         defender: Optional[IntoPokemon],
     ) -> None:
+        self.field_version = next(_field_versions)
         self.pokemon: list[Pokemon] = []
         queue = SpeedQueue()
         if attacker:
@@ -55,6 +114,11 @@ class GameState:
         while p := queue.next(self):
             enters_effects(p, self)
     
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in ("weather", "terrain"):
+            super().__setattr__("field_version", next(_field_versions))
+
     def get_hostile(self, perspective: Pokemon) -> list[Pokemon]:
         if perspective == self.attacker:
             return [self.defender]
@@ -72,4 +136,64 @@ class GameState:
         return self
 
     def calc(self, move: IntoMove) -> list[int]:
-        return damage_calc(self, self.attacker, self.defender, into_move(move))
+        move = self.format.dataset.into_move(move)
+        cache = self.format._calc_cache
+        if cache is None:
+            return damage_calc(self, self.attacker, self.defender, move)
+        return cache.calc(
+            self, move, lambda: damage_calc(self, self.attacker, self.defender, move)
+        )
+
+    def calc_many(self, moves: Iterable[IntoMove]) -> list[list[int]]:
+        """`calc` for each move, sharing the work that doesn't depend on the move."""
+        into_move = self.format.dataset.into_move
+        moves = [into_move(move) for move in moves]
+        cache = self.format._calc_cache
+        if cache is None:
+            return damage_calc_many(self, self.attacker, self.defender, moves)
+
+        keys = [fingerprint(self, move) for move in moves]
+        cached = [cache.get(key) for key in keys]
+        computed = iter(
+            damage_calc_many(
+                self,
+                self.attacker,
+                self.defender,
+                [move for move, rolls in zip(moves, cached) if rolls is None],
+            )
+        )
+        results = []
+        for key, rolls in zip(keys, cached):
+            if rolls is None:
+                rolls = next(computed)
+                cache.put(key, rolls)
+            results.append(rolls)
+        return results
+
+    def calc_result(self, move: IntoMove) -> DamageResult:
+        return DamageResult(self.calc(move))
+
+    def calc_many_results(self, moves: Iterable[IntoMove]) -> list[DamageResult]:
+        return [DamageResult(damage) for damage in self.calc_many(moves)]
+
+    def calc_distribution(
+        self, move: IntoMove, accuracy: bool = False
+    ) -> "DamageDistribution":
+        """
+        The exact distribution of `move`'s damage, hits and crits rolled
+        independently (calc.distribution), raises ImportError without numpy.
+        With `accuracy`, misses count as doing no damage.
+        """
+        from pokemon_damage_calculator.calc.distribution import damage_distribution
+
+        return damage_distribution(self, self.format.dataset.into_move(move), accuracy)
+
+    def ko_chances(self, move: IntoMove, turns: int = 4) -> list[float]:
+        """
+        The chance that using `move` every turn has KOed the defender from its
+        current HP after each of 1 to `turns` turns (calc.ko), raises
+        ImportError without numpy.
+        """
+        from pokemon_damage_calculator.calc.ko import game_ko_chances
+
+        return game_ko_chances(self, self.format.dataset.into_move(move), turns)
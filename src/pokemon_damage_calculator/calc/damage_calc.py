@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 import logging
-import math
 
 from pokemon_damage_calculator.calc.utils import (
-    floored_multiply,
-    pokemon_round,
-    pokerounded_multiply,
+    apply_modifier,
+    floored_modify_range,
+    modifier,
+    modify_range,
 )
 from pokemon_damage_calculator.model.enums import (
     Ability,
@@ -13,9 +13,12 @@ from pokemon_damage_calculator.model.enums import (
     MoveFlag,
     PokemonType,
     Status,
-    Target,
 )
 from pokemon_damage_calculator.model.logic import (
+    Auras,
+    calc_attacker_power_mults,
+    calc_auras,
+    calc_accuracy,
     calc_base_power,
     calc_effective_attack,
     calc_effective_defence,
@@ -25,14 +28,14 @@ from pokemon_damage_calculator.model.logic import (
     calc_other_multipliers,
     calc_type_effectiveness,
 )
-from pokemon_damage_calculator.model.models import Move
+from pokemon_damage_calculator.model.models import Move, MoveFeature
 
 from .pokemon import Pokemon
 
-from typing import TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .calcbuilder import GameState
+    from .calcbuilder import Format, GameState
 
 
 logger = logging.getLogger()
@@ -45,117 +48,35 @@ class _MoveDetails:
     ignores_ability: bool
     contact: bool
     crits: bool
+    auras: Auras
 
 
-def damage_calc(
-    game_state: "GameState", attacker: Pokemon, target: Pokemon, move: Move
-) -> list[int]:
+@dataclass
+class DamageInputs:
     """
-    Calculations as described in https://web.archive.org/web/20240516021936/https://www.trainertower.com/dawoblefets-damage-dissertation/.
-    That is a gen 7 resource, my research into what is known about gen 9 differences will happen later.
+    The values the final damage formula combines, for one attacker, target and
+    move. Multipliers are 4096-based modifiers, so the formula is integer only.
     """
-    if move.category == MoveCategory.Status:
-        return [0]
-
-    attacker_ignores_abilities = (
-        move.ignoreAbility
-        or attacker.has_ability(Ability.MoldBreaker)
-        or attacker.has_ability(Ability.Turboblaze)
-        or attacker.has_ability(Ability.Teravolt)
-    )
-    make_contact = move.has_flag(MoveFlag.Contact) and not attacker.has_ability(
-        Ability.LongReach
-    )
-
-    crits = target.ability not in [Ability.BattleArmor, Ability.ShellArmor] and (
-        move.willCrit
-        or move.name in ["Storm Throw", "Frost Breath"]
-        or attacker.ability == Ability.Merciless
-        and target.status in [Status.Poison, Status.Toxic]
-        # TODO Laser Focus or +3 crit chance
-    )
-
-    move_details = _MoveDetails(
-        move,
-        type=calc_move_type(attacker, target, move, game_state),
-        ignores_ability=attacker_ignores_abilities,
-        contact=make_contact,
-        crits=crits,
-    )
-
-    base_power = calc_base_power(attacker, target, move, game_state)
-    effective_power = calc_effective_power(
-        attacker, target, move_details, game_state, base_power
-    )
-    effective_attack = calc_effective_attack(attacker, target, move_details, game_state)
-    effective_defence = calc_effective_defence(
-        attacker, target, move_details, game_state
-    )
-    attacker_level: int = attacker.level
-
-    spread_multiplier = (
-        1
-        if not game_state.format._doubles
-        or move.target
-        in [
-            Target.Self,
-            Target.AdjacentAlly,
-            Target.AdjacentAllyOrSelf,
-            Target.AdjacentFoe,
-            Target.Any,
-            Target.Normal,
-            Target.RandomNormal,
-            Target.AllyTeam,
-            Target.Scripted,
-        ]
-        else 0.75
-    )
-
-    weather_multiplier = game_state.weather.type_multiplier(move.type)
-
-    # Exact values for crits are unknown as of gen 8
-    crit_multiplier = 1.5 if move_details.crits else 1.0
-
-    if move_details.type in attacker.species.types:
-        stab_multiplier = 2 if attacker.has_ability(Ability.Adaptability) else 1.5
-    else:
-        stab_multiplier = 1.0
-
-    type_effectiveness = calc_type_effectiveness(
-        attacker, target, move_details, game_state
-    )
-
-    burn_multiplier = (
-        0.5
-        if (
-            attacker.status == Status.Burn
-            and move.category == MoveCategory.Physical
-            and not attacker.ability == Ability.Guts
-            and move.name != "Facade"
-        )
-        else 1.0
-    )
-
-    other_multiplier = calc_other_multipliers(
-        attacker, target, move_details, game_state
-    )
 
-    # TODO Z-move ignores protect
-
-    if calc_immunities(attacker, target, move_details, game_state, type_effectiveness):
-        return [0 for _ in range(16)]
-
-    match move.multihit:
-        case n if isinstance(n, int):
-            nhits = n
-        case n if isinstance(n, tuple):  # tuple[int, int]
-            nhits = n[1]
-        case None:
-            nhits = 1
-        case _:
-            assert False
-    logger.info(
-        """
+    level: int
+    power: int
+    attack: int
+    defence: int
+    spread: int
+    weather: int
+    crit: int
+    type_effectiveness: int
+    stab: int
+    burn: int
+    other: int
+    nhits: int
+    immune: bool
+    parental_bond: bool
+    """Whether a Parental Bond second hit is added"""
+
+    def log(self) -> None:
+        logger.info(
+            """
         Attacker Level %s
         Effective Power %s
         Effective Attack %s
@@ -169,68 +90,365 @@ def damage_calc(
         other_multiplier %s
         nhits %s
         """,
-        attacker_level,
-        effective_power,
-        effective_attack,
-        effective_defence,
-        spread_multiplier,
-        weather_multiplier,
-        crit_multiplier,
-        type_effectiveness,
-        stab_multiplier,
-        burn_multiplier,
-        other_multiplier,
-        nhits,
+            self.level,
+            self.power,
+            self.attack,
+            self.defence,
+            self.spread,
+            self.weather,
+            self.crit,
+            self.type_effectiveness,
+            self.stab,
+            self.burn,
+            self.other,
+            self.nhits,
+        )
+
+
+class _Matchup:
+    """
+    Everything about a target and the field that doesn't depend on the move,
+    worked out once for any number of moves.
+    """
+
+    def __init__(
+        self, game_state: "GameState", attacker: Pokemon, target: Pokemon
+    ) -> None:
+        self.game_state = game_state
+        self.attacker = attacker
+        self.target = target
+        self.crit_immune = target.ability in [
+            Ability.BattleArmor,
+            Ability.ShellArmor,
+        ]
+        self.poisoned = target.status in [Status.Poison, Status.Toxic]
+        self.auras = calc_auras(game_state)
+        self._type_effectiveness: dict[PokemonType, float] = {}
+
+    def type_effectiveness(self, move_details: _MoveDetails) -> float:
+        if move_details.base_move.features & MoveFeature.SPECIAL_EFFECTIVENESS:
+            return calc_type_effectiveness(
+                self.attacker, self.target, move_details, self.game_state
+            )
+        result = self._type_effectiveness.get(move_details.type)
+        if result is None:
+            result = self._type_effectiveness[move_details.type] = (
+                calc_type_effectiveness(
+                    self.attacker, self.target, move_details, self.game_state
+                )
+            )
+        return result
+
+
+_NO_AURAS = Auras(fairy=False, dark=False, aura_break=False)
+
+# Indexed by crit stage, gen 7 onwards
+_CRIT_CHANCES = (1 / 24, 1 / 8, 1 / 2, 1.0)
+
+# Moves that hit 2-5 times, unless the attacker has Skill Link
+_MULTIHIT_WEIGHTS = ((2, 0.35), (3, 0.35), (4, 0.15), (5, 0.15))
+
+
+class CalcPlan:
+    """
+    Everything about an attacker, move and format that doesn't depend on the
+    target or field, worked out once for any number of them. Running a plan
+    doesn't change it, so it can be shared between threads. It is a snapshot:
+    compile a new one after changing the attacker or format.
+    """
+
+    __slots__ = (
+        "attacker",
+        "move",
+        "format",
+        "_details",
+        "_always_crits",
+        "_merciless",
+        "_base_power",
+        "_attacker_power_mults",
+        "_spread",
+        "_stab",
+        "_burn",
+        "_nhits",
+        "_hit_counts",
+        "_crit_chance",
+        "_parental_bond",
     )
 
-    def final_formula(parental_bond: bool):
-        damage = math.floor(
-            math.floor(
-                math.floor(attacker_level * 2.0 / 5.0 + 2.0)
-                * effective_power
-                * effective_attack
-                / effective_defence
+    def __init__(self, attacker: Pokemon, move: Move, format: "Format") -> None:
+        self.attacker = attacker
+        self.move = move
+        self.format = format
+
+        move_type = calc_move_type(attacker, move)
+        self._details = _MoveDetails(
+            move,
+            type=move_type,
+            ignores_ability=(
+                move.ignoreAbility
+                or attacker.has_ability(Ability.MoldBreaker)
+                or attacker.has_ability(Ability.Turboblaze)
+                or attacker.has_ability(Ability.Teravolt)
+            ),
+            contact=move.has_flag(MoveFlag.Contact)
+            and not attacker.has_ability(Ability.LongReach),
+            crits=False,
+            auras=_NO_AURAS,
+        )
+        """Without the target and field dependent parts: crits and auras"""
+        self._always_crits = move.has_feature(MoveFeature.SURE_CRIT)
+        # TODO Laser Focus or +3 crit chance
+        self._merciless = attacker.ability == Ability.Merciless
+        # TODO items
+        crit_stage = (move.critRatio or 1) - 1 + (attacker.ability == Ability.SuperLuck)
+        self._crit_chance = _CRIT_CHANCES[min(crit_stage, len(_CRIT_CHANCES) - 1)]
+        self._base_power = None if move.basePowerCallback else move.basePower
+        self._attacker_power_mults = calc_attacker_power_mults(attacker, self._details)
+
+        self._spread = (
+            3072 if format._doubles and move.features & MoveFeature.SPREAD else 4096
+        )
+
+        if move_type in attacker.species.types:
+            self._stab = 8192 if attacker.has_ability(Ability.Adaptability) else 6144
+        else:
+            self._stab = 4096
+
+        self._burn = (
+            2048
+            if (
+                attacker.status == Status.Burn
+                and move.category == MoveCategory.Physical
+                and not attacker.ability == Ability.Guts
+                and not move.features & MoveFeature.FACADE
             )
-            / 50.0
-            + 2.0
-        )  # From showdown, rounding diverges from bulbapedia
-        logger.info("Base damage: %s", damage)
+            else 4096
+        )
 
-        damage = pokemon_round(damage * spread_multiplier)
+        match move.multihit:
+            case n if isinstance(n, int):
+                self._nhits = n
+                self._hit_counts: tuple[tuple[int, float], ...] = ((n, 1.0),)
+            case n if isinstance(n, tuple):  # tuple[int, int]
+                self._nhits = n[1]
+                if attacker.has_ability(Ability.SkillLink):
+                    self._hit_counts = ((n[1], 1.0),)
+                elif n == (2, 5):
+                    self._hit_counts = _MULTIHIT_WEIGHTS
+                else:
+                    counts = range(n[0], n[1] + 1)
+                    self._hit_counts = tuple((i, 1 / len(counts)) for i in counts)
+            case None:
+                self._nhits = 1
+                self._hit_counts = ((1, 1.0),)
+            case _:
+                assert False
+
+        self._parental_bond = attacker.has_ability(
+            Ability.ParentalBond
+        ) and not move.has_flag(MoveFlag.NoParentalBond)
+
+    def run(self, target: Pokemon, game_state: "GameState") -> list[int]:
+        """The damage rolls against `target` with `game_state`'s field."""
+        return self._run(_Matchup(game_state, self.attacker, target))
+
+    def _run(self, matchup: _Matchup) -> list[int]:
+        if self.move.category == MoveCategory.Status:
+            return [0]
+        inputs = self.inputs(matchup)
+        if inputs.immune:
+            return [0 for _ in range(16)]
+        inputs.log()
+        if self.format._numpy_rolls:
+            from pokemon_damage_calculator.calc import rolls
+
+            damage = rolls.calc_rolls(rolls.columns([inputs]))[0].tolist()
+        else:
+            damage = calc_rolls(inputs)
+        logger.info("Damage: %s", damage)
+        return damage
 
-        if parental_bond:
-            damage = pokemon_round(damage * 0.25)
+    @property
+    def hit_counts(self) -> tuple[tuple[int, float], ...]:
+        """(number of hits, probability) for each number of times the move can hit."""
+        return self._hit_counts
+
+    def accuracy(self, matchup: _Matchup) -> float:
+        """The chance that the move hits, or each hit of a multiaccuracy move."""
+        return calc_accuracy(
+            self.attacker, matchup.target, self._details, matchup.game_state
+        )
 
-        damage = pokemon_round(damage * weather_multiplier)
+    def crit_chance(self, matchup: _Matchup) -> float:
+        """The chance that each hit crits."""
+        if matchup.crit_immune:
+            return 0.0
+        if self._always_crits or self._merciless and matchup.poisoned:
+            return 1.0
+        return self._crit_chance
 
-        # Glaive Rush
+    def inputs(self, matchup: _Matchup, crit: Optional[bool] = None) -> DamageInputs:
+        """
+        Everything the final formula needs, for a damaging move. `crit` decides
+        whether it crits, rather than only when it is sure to.
+        """
+        game_state = matchup.game_state
+        attacker = self.attacker
+        target = matchup.target
+        move = self.move
+
+        details = self._details
+        move_details = _MoveDetails(
+            move,
+            type=details.type,
+            ignores_ability=details.ignores_ability,
+            contact=details.contact,
+            crits=(
+                crit
+                if crit is not None
+                else not matchup.crit_immune
+                and (self._always_crits or self._merciless and matchup.poisoned)
+            ),
+            auras=matchup.auras,
+        )
 
-        damage = pokemon_round(damage * crit_multiplier)
+        base_power = self._base_power
+        if base_power is None:
+            base_power = calc_base_power(attacker, target, move, game_state)
+        effective_power = calc_effective_power(
+            attacker,
+            target,
+            move_details,
+            game_state,
+            base_power,
+            self._attacker_power_mults,
+        )
+        effective_attack = calc_effective_attack(
+            attacker, target, move_details, game_state
+        )
+        effective_defence = calc_effective_defence(
+            attacker, target, move_details, game_state
+        )
 
-        damage = [math.floor(damage * r / 100) for r in range(85, 101)]
+        weather_multiplier = modifier(game_state.weather.type_multiplier(move.type))
 
-        damage = pokerounded_multiply(damage, stab_multiplier)
+        # Exact values for crits are unknown as of gen 8
+        crit_multiplier = 6144 if move_details.crits else 4096
 
-        damage = floored_multiply(damage, type_effectiveness)
+        type_effectiveness = matchup.type_effectiveness(move_details)
 
-        damage = pokerounded_multiply(damage, burn_multiplier)
+        other_multiplier = modifier(
+            calc_other_multipliers(attacker, target, move_details, game_state)
+        )
 
-        damage = pokerounded_multiply(damage, other_multiplier)
+        # TODO Z-move ignores protect
 
-        # ZMOVE into prrotect
-        # TERA SHIELD?
+        immune = calc_immunities(
+            attacker, target, move_details, game_state, type_effectiveness
+        )
 
-        damage = pokerounded_multiply(damage, nhits)
+        return DamageInputs(
+            level=attacker.level,
+            power=effective_power,
+            attack=effective_attack,
+            defence=effective_defence,
+            spread=self._spread,
+            weather=weather_multiplier,
+            crit=crit_multiplier,
+            type_effectiveness=modifier(type_effectiveness),
+            stab=self._stab,
+            burn=self._burn,
+            other=other_multiplier,
+            nhits=self._nhits,
+            immune=immune,
+            parental_bond=self._parental_bond,
+        )
 
-        damage = [max(1, d) for d in damage]
-        damage = [d % 65536 for d in damage]
-        return damage
 
-    damage = final_formula(False)
-    if attacker.has_ability(Ability.ParentalBond) and not move.has_flag(
-        MoveFlag.NoParentalBond
-    ):
-        second_hit = final_formula(True)
+def damage_calc(
+    game_state: "GameState", attacker: Pokemon, target: Pokemon, move: Move
+) -> list[int]:
+    """
+    Calculations as described in https://web.archive.org/web/20240516021936/https://www.trainertower.com/dawoblefets-damage-dissertation/.
+    That is a gen 7 resource, my research into what is known about gen 9 differences will happen later.
+    """
+    return CalcPlan(attacker, move, game_state.format).run(target, game_state)
+
+
+def damage_calc_many(
+    game_state: "GameState",
+    attacker: Pokemon,
+    target: Pokemon,
+    moves: Iterable[Move],
+) -> list[list[int]]:
+    """`damage_calc` for each move, sharing the work that doesn't depend on it."""
+    matchup = _Matchup(game_state, attacker, target)
+    format = game_state.format
+    if not format._numpy_rolls:
+        return [CalcPlan(attacker, move, format)._run(matchup) for move in moves]
+
+    from pokemon_damage_calculator.calc import rolls
+
+    result: list[list[int]] = []
+    batch: list[DamageInputs] = []
+    batched: list[int] = []
+    for move in moves:
+        if move.category == MoveCategory.Status:
+            result.append([0])
+            continue
+        inputs = CalcPlan(attacker, move, format).inputs(matchup)
+        inputs.log()
+        batched.append(len(result))
+        batch.append(inputs)
+        result.append([])
+    if batch:
+        for i, damage in zip(batched, rolls.calc_rolls(rolls.columns(batch)).tolist()):
+            result[i] = damage
+    return result
+
+
+def calc_rolls(inputs: DamageInputs) -> list[int]:
+    """The damage rolls, with Parental Bond's second hit."""
+    damage = final_formula(inputs, False)
+    if inputs.parental_bond:
+        second_hit = final_formula(inputs, True)
         damage = [damage[i] + second_hit[i] for i in range(len(damage))]
-    logger.info("Damage: %s", damage)
+    return damage
+
+
+def final_formula(inputs: DamageInputs, parental_bond: bool) -> list[int]:
+    """The 16 rolls of one hit; `parental_bond` for Parental Bond's second one."""
+    damage = (
+        (inputs.level * 2 // 5 + 2) * inputs.power * inputs.attack // inputs.defence
+    ) // 50 + 2  # From showdown, rounding diverges from bulbapedia
+    logger.info("Base damage: %s", damage)
+
+    damage = apply_modifier(damage, inputs.spread)
+
+    if parental_bond:
+        damage = apply_modifier(damage, 1024)
+
+    damage = apply_modifier(damage, inputs.weather)
+
+    # Glaive Rush
+
+    damage = apply_modifier(damage, inputs.crit)
+
+    damage = [damage * r // 100 for r in range(85, 101)]
+
+    damage = modify_range(damage, inputs.stab)
+
+    damage = floored_modify_range(damage, inputs.type_effectiveness)
+
+    damage = modify_range(damage, inputs.burn)
+
+    damage = modify_range(damage, inputs.other)
+
+    # ZMOVE into prrotect
+    # TERA SHIELD?
+
+    damage = [d * inputs.nhits for d in damage]
+
+    damage = [max(1, d) for d in damage]
+    damage = [d % 65536 for d in damage]
     return damage
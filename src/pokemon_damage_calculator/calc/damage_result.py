@@ -0,0 +1,64 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional
+
+
+class DamageResult:
+    """
+    The damage rolls of a calc, held as a packed array rather than a list of
+    ints. Sort results by `sort_key`, their (min, max) roll.
+    """
+
+    __slots__ = ("_rolls", "min", "max")
+
+    def __init__(self, rolls: Iterable[int]) -> None:
+        # Unsigned 32 bit: a Parental Bond total can exceed 65535
+        self._rolls = array("I", rolls)
+        self.min = min(self._rolls)
+        self.max = max(self._rolls)
+
+    @property
+    def rolls(self) -> list[int]:
+        return self._rolls.tolist()
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return (self.min, self.max)
+
+    def percent(self, hp: int) -> tuple[float, float]:
+        """The min and max roll as percentages of `hp`."""
+        return (100 * self.min / hp, 100 * self.max / hp)
+
+    def ko_rolls(self, hp: int) -> int:
+        """How many rolls do at least `hp`."""
+        # Rolls are in ascending order
+        return len(self._rolls) - bisect_left(self._rolls, hp)
+
+    def ko_chance(self, hp: int) -> float:
+        """The chance that one hit does at least `hp`, all rolls being equally likely."""
+        return self.ko_rolls(hp) / len(self._rolls)
+
+    def hits_to_ko(self, hp: int) -> Optional[int]:
+        """How many hits are sure to do `hp`, None if the lowest roll is 0."""
+        if self.min == 0:
+            return None
+        return -(-hp // self.min)
+
+    def __len__(self) -> int:
+        return len(self._rolls)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._rolls)
+
+    def __getitem__(self, index: int) -> int:
+        return self._rolls[index]
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, DamageResult):
+            return self._rolls == value._rolls
+        if isinstance(value, list):
+            return self.rolls == value
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<DamageResult {self.min}-{self.max}>"
@@ -0,0 +1,200 @@
+"""
+The exact damage distribution of a move, with numpy (the `numpy` extra).
+
+`damage_calc` gives 16 rolls, as if every hit of a multi-hit move and Parental
+Bond's second hit rolled the same. Here each hit rolls and crits independently:
+a hit is a mix of its non-crit and crit rolls, the hits of a move are convolved
+together, and moves that hit 2-5 times mix the distributions of each number of
+hits. Every hit does the damage the first one would. Misses are included on
+request, checked once or, for multiaccuracy moves, before each hit.
+
+Distributions are cached by the rolls they come from, so many targets that take
+the same damage per hit share the convolutions.
+"""
+
+from dataclasses import replace
+from functools import lru_cache
+from typing import Sequence, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.distribution needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator.calc.damage_calc import (
+    CalcPlan,
+    _Matchup,
+    final_formula,
+)
+from pokemon_damage_calculator.model.enums import MoveCategory
+from pokemon_damage_calculator.model.models import Move
+
+if TYPE_CHECKING:
+    from pokemon_damage_calculator.calc.calcbuilder import GameState
+
+
+class DamageDistribution:
+    """
+    Total damage and its probability, in ascending order of damage. The arrays
+    may be shared with the cache, so they are read only.
+    """
+
+    __slots__ = ("damage", "probability")
+
+    def __init__(self, damage: np.ndarray, probability: np.ndarray) -> None:
+        self.damage = damage
+        self.probability = probability
+
+    @property
+    def min(self) -> int:
+        return int(self.damage[0])
+
+    @property
+    def max(self) -> int:
+        return int(self.damage[-1])
+
+    def mean(self) -> float:
+        return float(self.damage @ self.probability)
+
+    def ko_chance(self, hp: int) -> float:
+        """The chance of doing at least `hp`."""
+        start = np.searchsorted(self.damage, hp)
+        return float(self.probability[start:].sum())
+
+    def __len__(self) -> int:
+        return len(self.damage)
+
+    def __repr__(self) -> str:
+        return f"<DamageDistribution {self.min}-{self.max}, mean {self.mean():.1f}>"
+
+
+type _Key = tuple[tuple[int, ...], tuple[int, ...], float]
+"""(non-crit rolls, crit rolls, crit chance) of one hit"""
+
+
+def _frozen(damage: np.ndarray, probability: np.ndarray) -> DamageDistribution:
+    damage.flags.writeable = False
+    probability.flags.writeable = False
+    return DamageDistribution(damage, probability)
+
+
+def _merge(damage: np.ndarray, probability: np.ndarray) -> DamageDistribution:
+    """Sums the probabilities of equal damage."""
+    low = damage.min()
+    totals = np.bincount(damage - low, weights=probability)
+    (present,) = np.nonzero(totals)
+    return _frozen(present + low, totals[present])
+
+
+def _mix(
+    parts: Sequence[tuple[DamageDistribution, float]],
+) -> DamageDistribution:
+    if len(parts) == 1 and parts[0][1] == 1.0:
+        return parts[0][0]
+    return _merge(
+        np.concatenate([d.damage for d, _ in parts]),
+        np.concatenate([d.probability * weight for d, weight in parts]),
+    )
+
+
+def _convolve(a: DamageDistribution, b: DamageDistribution) -> DamageDistribution:
+    return _merge(
+        np.add.outer(a.damage, b.damage).ravel(),
+        np.multiply.outer(a.probability, b.probability).ravel(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _hit(key: _Key) -> DamageDistribution:
+    rolls, crit_rolls, crit_chance = key
+    parts = []
+    if crit_chance < 1:
+        parts.append((_rolls(rolls), 1 - crit_chance))
+    if crit_chance > 0:
+        parts.append((_rolls(crit_rolls), crit_chance))
+    return _mix(parts)
+
+
+def _rolls(rolls: tuple[int, ...]) -> DamageDistribution:
+    return _merge(np.array(rolls, dtype=np.int64), np.full(len(rolls), 1 / len(rolls)))
+
+
+@lru_cache(maxsize=4096)
+def _hits(key: _Key, second_key: _Key | None, n: int) -> DamageDistribution:
+    """`n` hits, each followed by Parental Bond's second hit if `second_key`."""
+    if n == 0:
+        return _NO_DAMAGE
+    if n > 1:
+        return _convolve(_hits(key, second_key, n - 1), _hits(key, second_key, 1))
+    if second_key is None:
+        return _hit(key)
+    return _convolve(_hit(key), _hit(second_key))
+
+
+def _key(plan: CalcPlan, matchup: _Matchup, parental_bond: bool) -> _Key:
+    crit_chance = plan.crit_chance(matchup)
+    rolls = crit_rolls = ()
+    if crit_chance < 1:
+        inputs = replace(plan.inputs(matchup, crit=False), nhits=1)
+        rolls = tuple(final_formula(inputs, parental_bond))
+    if crit_chance > 0:
+        inputs = replace(plan.inputs(matchup, crit=True), nhits=1)
+        crit_rolls = tuple(final_formula(inputs, parental_bond))
+    return (rolls, crit_rolls, crit_chance)
+
+
+_NO_DAMAGE = _frozen(np.zeros(1, dtype=np.int64), np.ones(1))
+
+
+def _checked_hit_counts(
+    hit_counts: Sequence[tuple[int, float]], accuracy: float
+) -> list[tuple[int, float]]:
+    """Hit counts when the move stops at the first miss."""
+    result = []
+    for n, p in hit_counts:
+        result.extend((k, p * accuracy**k * (1 - accuracy)) for k in range(n))
+        result.append((n, p * accuracy**n))
+    return [(n, p) for n, p in result if p > 0]
+
+
+def plan_distribution(
+    plan: CalcPlan, matchup: _Matchup, accuracy: bool = False
+) -> DamageDistribution:
+    """
+    `damage_distribution` for a compiled plan, as `CalcPlan._run` is to `run`.
+    With `accuracy`, misses count as doing no damage.
+    """
+    if plan.move.category == MoveCategory.Status:
+        return _NO_DAMAGE
+    inputs = plan.inputs(matchup)
+    if inputs.immune:
+        return _NO_DAMAGE
+
+    hit_counts = list(plan.hit_counts)
+    miss = 0.0
+    if accuracy:
+        chance = plan.accuracy(matchup)
+        if plan.move.multiaccuracy:
+            hit_counts = _checked_hit_counts(hit_counts, chance)
+        else:
+            miss = 1 - chance
+
+    key = _key(plan, matchup, False)
+    second_key = _key(plan, matchup, True) if inputs.parental_bond else None
+    parts = [(_hits(key, second_key, n), p * (1 - miss)) for n, p in hit_counts]
+    if miss > 0:
+        parts.append((_NO_DAMAGE, miss))
+    return _mix(parts)
+
+
+def damage_distribution(
+    game_state: "GameState", move: Move, accuracy: bool = False
+) -> DamageDistribution:
+    """The distribution of the damage `move` does to `game_state`'s defender."""
+    plan = CalcPlan(game_state.attacker, move, game_state.format)
+    return plan_distribution(
+        plan, _Matchup(game_state, game_state.attacker, game_state.defender), accuracy
+    )
@@ -0,0 +1,119 @@
+"""
+KO chances of using a move turn after turn, with numpy (the `numpy` extra).
+
+Each use does damage from the move's `distribution.DamageDistribution`, misses
+included. The chance of a KO within n turns comes from the damage dealt so far,
+capped at the target's HP: a dynamic program over HP remaining where a KO is
+the absorbing state. Each turn's state is cached by the distribution, cap and
+turn, so the turns before it and other targets with no more HP reuse it. Nothing
+heals the target or changes between turns.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Sequence, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.ko needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator.calc.damage_calc import CalcPlan, _Matchup
+from pokemon_damage_calculator.calc.distribution import (
+    DamageDistribution,
+    plan_distribution,
+)
+from pokemon_damage_calculator.calc.pokemon import IntoPokemon, into_pokemon
+from pokemon_damage_calculator.data import IntoMove
+from pokemon_damage_calculator.model.models import Move
+
+if TYPE_CHECKING:
+    from pokemon_damage_calculator.calc.calcbuilder import Format, GameState
+
+type _Key = tuple[bytes, bytes]
+"""A distribution's damage and probability arrays"""
+
+
+def _key(distribution: DamageDistribution) -> _Key:
+    return (distribution.damage.tobytes(), distribution.probability.tobytes())
+
+
+@lru_cache(maxsize=4096)
+def _dealt(key: _Key, cap: int, turns: int) -> np.ndarray:
+    """
+    The chance of having dealt each amount of damage after `turns` uses, the
+    last entry being `cap` or more.
+    """
+    if turns == 0:
+        result = np.zeros(cap + 1)
+        result[0] = 1.0
+    else:
+        damage = np.minimum(np.frombuffer(key[0], dtype=np.int64), cap)
+        probability = np.frombuffer(key[1], dtype=np.float64)
+        step = np.bincount(damage, weights=probability, minlength=cap + 1)
+        total = np.convolve(_dealt(key, cap, turns - 1), step)
+        result = total[: cap + 1].copy()
+        result[cap] = total[cap:].sum()
+    result.flags.writeable = False
+    return result
+
+
+def ko_chances(
+    distribution: DamageDistribution, hp: int, turns: int = 4
+) -> list[float]:
+    """The chance of dealing at least `hp` within each of 1 to `turns` uses."""
+    return _ko_chances(_key(distribution), [hp], turns)[0]
+
+
+def _ko_chances(key: _Key, hps: Sequence[int], turns: int) -> list[list[float]]:
+    """`ko_chances` for many targets that take the same damage."""
+    cap = max([1, *hps])
+    dealt = [_dealt(key, cap, turn) for turn in range(1, turns + 1)]
+    return [
+        [min(1.0, float(d[hp:].sum())) for d in dealt] if hp > 0 else [1.0] * turns
+        for hp in hps
+    ]
+
+
+def game_ko_chances(game_state: "GameState", move: Move, turns: int = 4) -> list[float]:
+    """`ko_chances` of `move` against `game_state`'s defender from its current HP."""
+    plan = CalcPlan(game_state.attacker, move, game_state.format)
+    matchup = _Matchup(game_state, game_state.attacker, game_state.defender)
+    distribution = plan_distribution(plan, matchup, accuracy=True)
+    return ko_chances(distribution, game_state.defender.current_hp, turns)
+
+
+def ko_chances_many(
+    format: "Format",
+    pairs: Iterable[tuple[IntoPokemon, IntoPokemon]],
+    move: IntoMove,
+    turns: int = 4,
+) -> list[list[float]]:
+    """
+    `game_ko_chances` for each (attacker, defender), as a fresh
+    `format.game(attacker, defender)` would give it. Pairs whose damage has the
+    same distribution share its turns.
+    """
+    from pokemon_damage_calculator.calc.calcbuilder import GameState
+
+    move = format.dataset.into_move(move)
+    groups: dict[_Key, list[tuple[int, int]]] = {}
+    n = 0
+    for attacker, defender in pairs:
+        game_state = GameState(
+            format, into_pokemon(attacker).copy(), into_pokemon(defender).copy()
+        )
+        plan = CalcPlan(game_state.attacker, move, format)
+        matchup = _Matchup(game_state, game_state.attacker, game_state.defender)
+        key = _key(plan_distribution(plan, matchup, accuracy=True))
+        groups.setdefault(key, []).append((n, game_state.defender.current_hp))
+        n += 1
+
+    result: list[list[float]] = [[] for _ in range(n)]
+    for key, members in groups.items():
+        chances = _ko_chances(key, [hp for _, hp in members], turns)
+        for (i, _), chance in zip(members, chances):
+            result[i] = chance
+    return result
@@ -1,11 +1,18 @@
+import copy
+from dataclasses import replace
 import logging
 import math
 from typing import Optional, TYPE_CHECKING
 
+from pokemon_damage_calculator.calc.stat_tables import (
+    NATURE_MULTIPLIERS,
+    nature_index,
+    raw_stat,
+)
 from pokemon_damage_calculator.data import get_nature, get_species
 from pokemon_damage_calculator.model.enums import Ability, PokemonType, Stat, Status
 from pokemon_damage_calculator.model.logic import stat_modifications
-from pokemon_damage_calculator.model.models import NatureModel, Species
+from pokemon_damage_calculator.model.models import Boosts, NatureModel, Species
 from pokemon_damage_calculator.model.natures import Nature
 from ..model.models import StatDistribution
 
@@ -14,8 +21,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger()
 
+_RAW_STAT_INPUTS = frozenset({"species", "evs", "ivs", "nature", "level"})
+_STAT_INPUTS = frozenset({"ability", "item", "status", "boosts"})
+
 
 class Pokemon:
+    """
+    Raw stats are cached until a stat input is reassigned, and effective stats
+    until that or the game state's field changes. Mutating `evs`, `ivs` or
+    `boosts` in place bypasses this, so call `invalidate_stats` afterwards.
+    """
+
     def __init__(
         self,
         species: Species,
@@ -26,6 +42,9 @@ class Pokemon:
         item=None,
         level=50,
     ) -> None:
+        self._raw_stats: list[Optional[int]] = [None] * len(Stat)
+        self._stats: list[Optional[tuple[int, int]]] = [None] * len(Stat)
+        """(field version of the game state, effective stat)"""
         self.species = species
         self.evs = evs
         self.nature = nature
@@ -35,32 +54,41 @@ class Pokemon:
         self.status: Optional[Status] = None
         self.current_hp = self.raw_stat(Stat.HP)
         self.item = item
-        self.boosts = StatDistribution.flat()
+        self.boosts = Boosts()
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _RAW_STAT_INPUTS:
+            self.invalidate_stats()
+        elif name in _STAT_INPUTS:
+            self._stats = [None] * len(Stat)
+
+    def invalidate_stats(self) -> None:
+        self._raw_stats = [None] * len(Stat)
+        self._stats = [None] * len(Stat)
+
+    def copy(self) -> "Pokemon":
+        """A copy whose boosts and stat caches are its own."""
+        result = copy.copy(self)
+        result.boosts = replace(self.boosts)
+        result.invalidate_stats()
+        return result
 
     def raw_stat(self, stat: Stat) -> int:
-        if self.nature.increases(stat):
-            nature = 1.1
-        elif self.nature.decreases(stat):
-            nature = 0.9
-        else:
-            nature = 1.0
-
-        base = self.species.baseStats[stat]
-        ev = self.evs[stat]
-        iv = self.ivs[stat]
-        level = self.level
-
-        if stat != Stat.HP:
-            return math.floor(
-                (math.floor((2 * base + iv + math.floor(ev / 4)) * level / 100) + 5)
-                * nature
-            )
-        else:
-            return (
-                math.floor((2 * base + iv + math.floor(ev / 4)) * level / 100)
-                + level
-                + 10
-            )
+        result = self._raw_stats[stat.ordinal]
+        if result is None:
+            result = self._raw_stats[stat.ordinal] = self._calc_raw_stat(stat)
+        return result
+
+    def _calc_raw_stat(self, stat: Stat) -> int:
+        return raw_stat(
+            self.species.baseStats[stat],
+            self.evs[stat],
+            self.ivs[stat],
+            self.level,
+            NATURE_MULTIPLIERS[nature_index(self.nature, stat)],
+            stat is Stat.HP,
+        )
 
     def boost_fraction(self, stat: Stat) -> float:
         numerator = max(2, 2 + self.boosts[stat])
@@ -68,6 +96,9 @@ class Pokemon:
         return numerator / denominator
 
     def stat(self, stat: Stat, game_state: "GameState") -> int:
+        cached = self._stats[stat.ordinal]
+        if cached is not None and cached[0] == game_state.field_version:
+            return cached[1]
         raw_stat = self.raw_stat(stat)
         result = stat_modifications(self, game_state, stat, raw_stat)
         result = math.floor(result * self.boost_fraction(stat))
@@ -77,6 +108,7 @@ class Pokemon:
             stat,
             result,
         )
+        self._stats[stat.ordinal] = (game_state.field_version, result)
         return result
 
     def has_ability(self, ability: Ability) -> bool:
@@ -147,11 +179,12 @@ class PokemonBuilder:
         return self
 
     def build(self) -> Pokemon:
+        # Copies, so that changing this builder doesn't change what it built
         return Pokemon(
             self._species,
             self._ability,
-            self._evs,
-            self._ivs,
+            replace(self._evs),
+            replace(self._ivs),
             self._nature,
             self._item,
             self._level,
@@ -0,0 +1,112 @@
+"""
+`damage_calc.final_formula` over arrays of inputs, with numpy (the `numpy`
+extra). Like the list version it is integer only, so the rolls are identical.
+
+Select it for a format with `Format.numpy_rolls()`. One calc is no faster than
+the list version; `calc_many` and `vectorized.damage_against` compute all their
+rolls in one pass.
+"""
+
+from typing import Sequence, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.rolls needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+if TYPE_CHECKING:
+    from pokemon_damage_calculator.calc.damage_calc import DamageInputs
+
+ROLLS = np.arange(85, 101, dtype=np.int64)
+
+
+def apply_modifier(n: np.ndarray, modifier) -> np.ndarray:
+    """`utils.apply_modifier` elementwise."""
+    return (n * modifier + 2047) // 4096
+
+
+def final_formula(
+    level,
+    power,
+    attack,
+    defence,
+    spread,
+    weather,
+    crit,
+    type_effectiveness,
+    stab,
+    burn,
+    other,
+    nhits,
+    parental_bond: bool,
+) -> np.ndarray:
+    """
+    (n, 16) rolls of one hit for n sets of inputs. Each argument is a scalar or
+    an int array of length n; `parental_bond` for Parental Bond's second hit.
+    """
+
+    def per_row(value) -> np.ndarray:
+        return np.reshape(np.asarray(value, dtype=np.int64), (-1, 1))
+
+    level = np.asarray(level, dtype=np.int64)
+    damage = (level * 2 // 5 + 2) * power * attack // defence // 50 + 2
+    damage = apply_modifier(damage, spread)
+    if parental_bond:
+        damage = apply_modifier(damage, 1024)
+    damage = apply_modifier(damage, weather)
+    damage = apply_modifier(damage, crit)
+
+    rolls = per_row(damage) * ROLLS // 100
+    rolls = apply_modifier(rolls, per_row(stab))
+    rolls = rolls * per_row(type_effectiveness) // 4096
+    rolls = apply_modifier(rolls, per_row(burn))
+    rolls = apply_modifier(rolls, per_row(other))
+    rolls = rolls * per_row(nhits)
+    return np.maximum(rolls, 1) % 65536
+
+
+_INT_COLUMNS = (
+    "level",
+    "power",
+    "attack",
+    "defence",
+    "spread",
+    "weather",
+    "crit",
+    "type_effectiveness",
+    "stab",
+    "burn",
+    "other",
+    "nhits",
+)
+_BOOL_COLUMNS = ("immune", "parental_bond")
+
+
+def columns(inputs: Sequence["DamageInputs"]) -> dict[str, np.ndarray]:
+    """`DamageInputs` as one array per field."""
+    result = {}
+    for names, dtype in [
+        (_INT_COLUMNS, np.int64),
+        (_BOOL_COLUMNS, bool),
+    ]:
+        for name in names:
+            result[name] = np.array([getattr(x, name) for x in inputs], dtype=dtype)
+    return result
+
+
+def calc_rolls(columns: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    (n, 16) damage rolls as `damage_calc.calc_rolls` gives them, with Parental
+    Bond's second hit, and zeros where the target is immune.
+    """
+    args = [columns[name] for name in _INT_COLUMNS]
+    damage = final_formula(*args, parental_bond=False)
+    parental_bond = columns["parental_bond"]
+    if parental_bond.any():
+        second_hit = final_formula(*args, parental_bond=True)
+        damage += np.where(parental_bond[:, None], second_hit, 0)
+    damage[columns["immune"]] = 0
+    return damage
@@ -0,0 +1,115 @@
+"""
+Precomputed raw stats for sweeping over spreads.
+
+The stat formula only depends on the EVs and IVs through `ev // 4 + iv`, so a
+column of every reachable value for one base stat and level is 95 points for
+each of the three nature multipliers. Columns are shared by every species with
+that base stat.
+"""
+
+from array import array
+from bisect import bisect_left
+from functools import cache
+import math
+from typing import Optional
+
+from pokemon_damage_calculator.data import IntoSpecies, into_species
+from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.model.models import NatureModel, StatDistribution
+
+MAX_EV = 255
+MAX_IV = 31
+EV_STEPS = range(0, 253, 4)
+"""The EV amounts that change a stat, up to the 252 a single stat can take."""
+
+_POINTS = MAX_EV // 4 + MAX_IV + 1
+NATURE_MULTIPLIERS = (0.9, 1.0, 1.1)
+
+
+def raw_stat(
+    base: int, ev: int, iv: int, level: int, nature_multiplier: float, is_hp: bool
+) -> int:
+    if not is_hp:
+        return math.floor(
+            (math.floor((2 * base + iv + math.floor(ev / 4)) * level / 100) + 5)
+            * nature_multiplier
+        )
+    else:
+        return (
+            math.floor((2 * base + iv + math.floor(ev / 4)) * level / 100) + level + 10
+        )
+
+
+def nature_index(nature: NatureModel, stat: Stat) -> int:
+    """Index of the nature's multiplier for `stat` in (0.9, 1.0, 1.1)."""
+    if nature.increases(stat):
+        return 2
+    elif nature.decreases(stat):
+        return 0
+    return 1
+
+
+@cache
+def _column(base: int, level: int, is_hp: bool) -> array:
+    """Stat values indexed by `(ev // 4 + iv) * 3 + nature_index`."""
+    return array(
+        "H",
+        (
+            raw_stat(base, 4 * point, 0, level, multiplier, is_hp)
+            for point in range(_POINTS)
+            for multiplier in NATURE_MULTIPLIERS
+        ),
+    )
+
+
+class StatTable:
+    """Every raw stat a species can have at one level. EVs are 0-255, IVs 0-31."""
+
+    __slots__ = ("species", "level", "_columns")
+
+    def __init__(self, species: IntoSpecies, level: int = 50) -> None:
+        self.species = into_species(species)
+        self.level = level
+        self._columns = [
+            _column(self.species.baseStats[stat], level, stat is Stat.HP)
+            for stat in Stat
+        ]
+
+    def lookup(self, stat: Stat, ev: int, iv: int, nature: NatureModel) -> int:
+        column = self._columns[stat.ordinal]
+        return column[(ev // 4 + iv) * 3 + nature_index(nature, stat)]
+
+    def stats(
+        self, evs: StatDistribution, ivs: StatDistribution, nature: NatureModel
+    ) -> StatDistribution:
+        result = StatDistribution.flat()
+        for stat in Stat:
+            result[stat] = self.lookup(stat, evs[stat], ivs[stat], nature)
+        return result
+
+    def sweep(self, stat: Stat, nature: NatureModel, iv: int = MAX_IV) -> list[int]:
+        """The stat at every amount in EV_STEPS."""
+        column = self._columns[stat.ordinal]
+        n = nature_index(nature, stat)
+        return [column[(ev // 4 + iv) * 3 + n] for ev in EV_STEPS]
+
+    def min_evs(
+        self, stat: Stat, target: int, nature: NatureModel, iv: int = MAX_IV
+    ) -> Optional[int]:
+        """The fewest EVs that reach `target`, None if no amount does."""
+        values = self.sweep(stat, nature, iv)
+        i = bisect_left(values, target)
+        return EV_STEPS[i] if i < len(values) else None
+
+
+_tables: dict[tuple[str, tuple[int, ...], int], StatTable] = {}
+
+
+def stat_table(species: IntoSpecies, level: int = 50) -> StatTable:
+    """Cached per species (and its base stats, which differ between gens) and level."""
+    species = into_species(species)
+    key = (species.name, tuple(species.baseStats[stat] for stat in Stat), level)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = StatTable(species, level)
+    return table
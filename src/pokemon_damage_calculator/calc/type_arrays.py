@@ -0,0 +1,50 @@
+"""
+`model.type_chart` lookups over arrays, with numpy (the `numpy` extra).
+
+Types are given as `type_chart.TYPE_INDEX` indices and defenders as
+`type_chart.pair_index` columns.
+"""
+
+from functools import cache
+from typing import Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.type_arrays needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator.model import type_chart
+from pokemon_damage_calculator.model.enums import PokemonType
+
+
+@cache
+def effectiveness_matrix(special: int = 0, strong_winds: bool = False) -> np.ndarray:
+    """(move types, defender type combinations) `type_chart.effectiveness_table`."""
+    result = np.array(
+        type_chart.effectiveness_table(special, strong_winds), dtype=np.float64
+    ).reshape(len(type_chart.TYPES), type_chart.PAIRS)
+    result.flags.writeable = False
+    return result
+
+
+def type_indices(types: Iterable[PokemonType]) -> np.ndarray:
+    return np.array([type_chart.TYPE_INDEX[t] for t in types], dtype=np.int64)
+
+
+def pair_indices(defender_types: Iterable[Sequence[PokemonType]]) -> np.ndarray:
+    return np.array(
+        [type_chart.pair_index(types) for types in defender_types], dtype=np.int64
+    )
+
+
+def lookup(
+    move_types, pairs, special: int = 0, strong_winds: bool = False
+) -> np.ndarray:
+    """
+    Effectiveness of each move type against each defender, `move_types` and
+    `pairs` being index arrays that broadcast against each other.
+    """
+    return effectiveness_matrix(special, strong_winds)[move_types, pairs]
@@ -1,16 +1,20 @@
-import math
+def modifier(multiplier: float) -> int:
+    """`multiplier` as a 4096-based fixed-point modifier, e.g. 1.5 -> 6144."""
+    return round(multiplier * 4096)
 
 
-def floored_multiply(damage_range: list[int], multiplier: float) -> list[int]:
-    return [math.floor(d * multiplier) for d in damage_range]
+def apply_modifier(n: int, modifier: int) -> int:
+    """n * modifier / 4096, rounded to nearest with halves rounded down."""
+    return (n * modifier + 2047) // 4096
 
 
-EPSILON = 0.0001
+def apply_floored_modifier(n: int, modifier: int) -> int:
+    return n * modifier // 4096
 
 
-def pokemon_round(n: float) -> int:
-    return round(n - EPSILON)
+def modify_range(damage_range: list[int], modifier: int) -> list[int]:
+    return [(d * modifier + 2047) // 4096 for d in damage_range]
 
 
-def pokerounded_multiply(damage_range: list[int], multiplier: float) -> list[int]:
-    return [pokemon_round(d * multiplier) for d in damage_range]
+def floored_modify_range(damage_range: list[int], modifier: int) -> list[int]:
+    return [d * modifier // 4096 for d in damage_range]
@@ -0,0 +1,148 @@
+"""
+One attacker and move against many defenders, with numpy (the `numpy` extra).
+
+Defenders that share types, ability and status only differ in their defensive
+stats as far as `damage_calc` is concerned, so the scalar logic runs once per
+such group and the rolls for every defender are computed together. Each result
+is what a fresh `Format.game(attacker, defender).calc(move)` would give.
+"""
+
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.calc.vectorized needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator.calc import rolls
+from pokemon_damage_calculator.calc.calcbuilder import Format, GameState
+from pokemon_damage_calculator.calc.damage_calc import (
+    CalcPlan,
+    DamageInputs,
+    _Matchup,
+)
+from pokemon_damage_calculator.calc.pokemon import IntoPokemon, Pokemon, into_pokemon
+from pokemon_damage_calculator.data import IntoMove
+from pokemon_damage_calculator.model.enums import MoveCategory, Stat
+from pokemon_damage_calculator.model.logic import (
+    AURA_ABILITIES,
+    ENTRY_ABILITIES,
+    calc_defence_stat,
+    calc_weather_defence_boost,
+)
+from pokemon_damage_calculator.model.models import Move, MoveFeature
+
+
+class DefenderTable:
+    """
+    Defenders as columns. It reads the pokemon once, so rebuild it after
+    changing any of them.
+    """
+
+    def __init__(self, defenders: Iterable[IntoPokemon]) -> None:
+        self.pokemon: list[Pokemon] = [into_pokemon(p) for p in defenders]
+        self.current_hp = np.array([p.current_hp for p in self.pokemon], dtype=np.int64)
+        self.types = [tuple(p.get_types()) for p in self.pokemon]
+        self.abilities = [p.ability for p in self.pokemon]
+        self.scalar = np.array(
+            [
+                ability in ENTRY_ABILITIES or ability in AURA_ABILITIES
+                for ability in self.abilities
+            ],
+            dtype=bool,
+        )
+        """Defenders that change the field on entry, which only the scalar path models"""
+
+        groups: dict[tuple, int] = {}
+        self.group = np.array(
+            [
+                groups.setdefault((types, p.ability, p.status), len(groups))
+                for types, p in zip(self.types, self.pokemon)
+            ],
+            dtype=np.int64,
+        )
+        """Defenders with the same group only differ in their stats"""
+        self._stats: dict[tuple, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.pokemon)
+
+    def stats(self, stat: Stat, game_state: GameState) -> np.ndarray:
+        """Each defender's `stat` on `game_state`'s field."""
+        key = (stat, game_state.weather, game_state.terrain)
+        result = self._stats.get(key)
+        if result is None:
+            result = self._stats[key] = np.array(
+                [p.stat(stat, game_state) for p in self.pokemon], dtype=np.int64
+            )
+        return result
+
+
+def _needs_scalar(move: Move) -> bool:
+    """Moves that read more of the target than its group and defensive stats."""
+    return bool(move.basePowerCallback) or move.overrideOffensivePokemon is not None
+
+
+def damage_against(
+    format: Format,
+    attacker: IntoPokemon,
+    defenders: DefenderTable | Iterable[IntoPokemon],
+    move: IntoMove,
+) -> np.ndarray:
+    """(defenders, 16) rolls; status moves and immune defenders give zeros."""
+    attacker = into_pokemon(attacker)
+    table = (
+        defenders if isinstance(defenders, DefenderTable) else DefenderTable(defenders)
+    )
+    move = format.dataset.into_move(move)
+    result = np.zeros((len(table), 16), dtype=np.int64)
+    if move.category == MoveCategory.Status or not len(table):
+        return result
+
+    scalar = table.scalar | _needs_scalar(move)
+    for i in np.flatnonzero(scalar):
+        game = GameState(format, attacker.copy(), table.pokemon[i].copy())
+        result[i] = game.calc(move)
+
+    vector = np.flatnonzero(~scalar)
+    if len(vector):
+        result[vector] = _damage_against(format, attacker, table, vector, move)
+    return result
+
+
+def _damage_against(
+    format: Format,
+    attacker: Pokemon,
+    table: DefenderTable,
+    indices: np.ndarray,
+    move: Move,
+) -> np.ndarray:
+    # None of these defenders has an entry effect, so any one of them leaves the
+    # attacker and field as all of them would
+    game_state = GameState(format, attacker.copy(), table.pokemon[indices[0]].copy())
+    defence_stat = calc_defence_stat(move)
+    defence = table.stats(defence_stat, game_state)[indices]
+
+    groups = table.group[indices]
+    if move.features & MoveFeature.BRINE:
+        hp = table.stats(Stat.HP, game_state)[indices]
+        groups = groups * 2 + (table.current_hp[indices] <= hp // 2)
+    _, first, inverse = np.unique(groups, return_index=True, return_inverse=True)
+
+    plan = CalcPlan(game_state.attacker, move, format)
+    inputs: list[DamageInputs] = []
+    boosted: list[bool] = []
+    for i in first:
+        representative = table.pokemon[indices[i]]
+        game_state.switch_defender(representative)
+        inputs.append(plan.inputs(_Matchup(game_state, plan.attacker, representative)))
+        boosted.append(calc_weather_defence_boost(representative, game_state))
+
+    columns = {name: column[inverse] for name, column in rolls.columns(inputs).items()}
+    columns["defence"] = np.where(
+        np.array(boosted)[inverse], rolls.apply_modifier(defence, 6144), defence
+    )
+    return rolls.calc_rolls(columns)
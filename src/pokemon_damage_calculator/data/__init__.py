@@ -1,54 +1,213 @@
-from typing import Optional
-from serde import serde
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 from serde.json import from_json
 
+from pokemon_damage_calculator.data.learnset import Learnset
+from pokemon_damage_calculator.data.learnset_index import (
+    LearnsetIndex,
+    open_learnset_index,
+    write_learnset_index,
+)
+from pokemon_damage_calculator.data.names import NameIndex
+from pokemon_damage_calculator.data.registry import Dataset as Dataset
+from pokemon_damage_calculator.data.registry import get_dataset as get_dataset
+from pokemon_damage_calculator.data.snapshot import load_snapshot, write_snapshot
+from pokemon_damage_calculator.data.streaming import iter_learnsets
 from pokemon_damage_calculator.model.models import Move, Species
 from pokemon_damage_calculator.model.models import NatureModel
-from pokemon_damage_calculator.utils import clean_name
 
-with open("data/pokedex.json") as f:
-    _pokedex = from_json(dict[str, Species], f.read())
 
-with open("data/moves.json") as f:
-    _moves = from_json(dict[str, Move], f.read())
+# Each table is parsed the first time it is needed rather than at import, so a
+# process that only resolves moves never pays for the pokedex or learnsets.
 
-with open("data/natures.json") as f:
-    _natures = from_json(dict[str, dict[str, NatureModel]], f.read())
 
+def _parse_pokedex(source: str) -> dict[str, Species]:
+    with open(source) as f:
+        return from_json(dict[str, Species], f.read())
 
-@serde
-class _Learnset:
-    learnset: Optional[dict[str, list[str]]]
-    eventdata: Optional[dict]
 
-    def __repr__(self) -> str:
-        return repr(self.learnset)
+def _parse_moves(source: str) -> dict[str, Move]:
+    with open(source) as f:
+        return from_json(dict[str, Move], f.read())
 
 
-with open("data/learnsets.json") as f:
-    _temp = from_json(dict[str, _Learnset], f.read())
-    _learnsets = {
-        pokemon: [_moves[move] for move in _temp[pokemon].learnset or {}]
-        for pokemon in _temp
+def _parse_natures(source: str) -> dict[str, dict[str, NatureModel]]:
+    with open(source) as f:
+        return from_json(dict[str, dict[str, NatureModel]], f.read())
+
+
+def _parse_species_overrides(source: str) -> dict[str, dict[str, dict]]:
+    # Generation 9 of species.json is a full dex of its own; pokedex.json is ours.
+    with open(source) as f:
+        return {gen: species for gen, species in json.load(f).items() if gen != "9"}
+
+
+def _parse_learnsets(source: str) -> dict[str, list[str]]:
+    # Streamed: the file is large and mostly event data we never read.
+    return dict(iter_learnsets(source))
+
+
+_SOURCES: dict[str, Callable[[str], Any]] = {
+    "data/pokedex.json": _parse_pokedex,
+    "data/moves.json": _parse_moves,
+    "data/natures.json": _parse_natures,
+    "data/species.json": _parse_species_overrides,
+    "data/learnsets.json": _parse_learnsets,
+}
+
+
+def _load_table(source: str) -> Any:
+    table = load_snapshot(source)
+    if table is None:
+        table = _SOURCES[source](source)
+    return table
+
+
+def build_snapshots() -> list[Path]:
+    """Parse every JSON table and write its binary snapshot and the learnset index."""
+    tables = {}
+    paths = []
+    for source, parse in _SOURCES.items():
+        tables[source] = parse(source)
+        paths.append(write_snapshot(source, tables[source]))
+    paths.append(
+        write_learnset_index(
+            tables["data/learnsets.json"],
+            list(tables["data/moves.json"]),
+            "data/learnsets.json",
+            "data/moves.json",
+        )
+    )
+    return paths
+
+
+@cache
+def _load_pokedex() -> dict[str, Species]:
+    return _load_table("data/pokedex.json")
+
+
+@cache
+def _load_moves() -> dict[str, Move]:
+    return _load_table("data/moves.json")
+
+
+@cache
+def _load_natures() -> dict[str, dict[str, NatureModel]]:
+    return _load_table("data/natures.json")
+
+
+@cache
+def _load_species_overrides() -> dict[str, dict[str, dict]]:
+    """species.json overrides for the older generations, keyed by generation."""
+    return _load_table("data/species.json")
+
+
+@cache
+def _load_learnsets() -> dict[str, Learnset]:
+    names = _move_names()
+    return {
+        pokemon: Learnset.from_ids(names.resolve_many(learnset))
+        for pokemon, learnset in _load_table("data/learnsets.json").items()
     }
 
 
+@cache
+def _move_list() -> list[Move]:
+    """Moves in moves.json order, so that a move id indexes into it."""
+    return list(_load_moves().values())
+
+
+@cache
+def _species_list() -> list[Species]:
+    return list(_load_pokedex().values())
+
+
+@cache
+def _species_keys() -> list[str]:
+    return list(_load_pokedex())
+
+
+@cache
+def _nature_list() -> list[NatureModel]:
+    return list(_load_natures()["9"].values())
+
+
+@cache
+def _move_names() -> NameIndex:
+    return NameIndex((key, move.name) for key, move in _load_moves().items())
+
+
+@cache
+def _species_names() -> NameIndex:
+    return NameIndex((key, species.name) for key, species in _load_pokedex().items())
+
+
+@cache
+def _nature_names() -> NameIndex:
+    return NameIndex((key, nature.name) for key, nature in _load_natures()["9"].items())
+
+
+@cache
+def _open_learnset_index() -> Optional[LearnsetIndex]:
+    return open_learnset_index("data/learnsets.json", "data/moves.json")
+
+
+_LAZY_TABLES: dict[str, Callable[[], dict]] = {
+    "_pokedex": _load_pokedex,
+    "_moves": _load_moves,
+    "_natures": _load_natures,
+    "_learnsets": _load_learnsets,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_TABLES:
+        return _LAZY_TABLES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_species(species_name: str) -> Species:
-    return _pokedex[clean_name(species_name)]
+    return _species_list()[_species_names().resolve(species_name)]
 
 
 def get_move(move_name: str) -> Move:
-    return _moves[clean_name(move_name)]
+    return _move_list()[_move_names().resolve(move_name)]
 
 
 def get_nature(nature_name: str) -> NatureModel:
-    return _natures["9"][clean_name(nature_name)]
+    return _nature_list()[_nature_names().resolve(nature_name)]
+
+
+def resolve_species(species_names: Iterable[str]) -> list[Species]:
+    species = _species_list()
+    return [species[i] for i in _species_names().resolve_many(species_names)]
+
+
+def resolve_moves(move_names: Iterable[str]) -> list[Move]:
+    moves = _move_list()
+    return [moves[i] for i in _move_names().resolve_many(move_names)]
 
 
-def get_learnset(species: "IntoSpecies") -> list[Move]:
+def search_species(prefix: str, limit: Optional[int] = None) -> list[Species]:
+    species = _species_list()
+    return [species[i] for i in _species_names().search(prefix, limit)]
+
+
+def search_moves(prefix: str, limit: Optional[int] = None) -> list[Move]:
+    moves = _move_list()
+    return [moves[i] for i in _move_names().search(prefix, limit)]
+
+
+def get_learnset(species: "IntoSpecies") -> Learnset:
     species = into_species(species)
     name = species.baseSpecies or species.name
-    return _learnsets[clean_name(name)]
+    key = _species_keys()[_species_names().resolve(name)]
+    index = _open_learnset_index()
+    if index is None:
+        return _load_learnsets()[key]
+    return Learnset.from_ids(index.move_ids(key))
 
 
 type IntoMove = Move | str
@@ -61,6 +220,11 @@ def into_move(move: IntoMove) -> Move:
         return move
 
 
+def move_id(move: IntoMove) -> int:
+    """Dense id of a move: its position in moves.json."""
+    return _move_names().resolve(move if isinstance(move, str) else move.name)
+
+
 type IntoSpecies = Species | str
 
 
@@ -0,0 +1,93 @@
+from array import array
+from typing import Callable, Iterable, Iterator
+
+from pokemon_damage_calculator import data
+from pokemon_damage_calculator.model.models import Move
+
+
+class Learnset:
+    """
+    A set of moves stored as a bitset over move ids, so membership is a shift and
+    union/intersection are single integer operations. Move objects are only
+    looked up when iterating.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, bits: int = 0) -> None:
+        self._bits = bits
+
+    @staticmethod
+    def from_ids(move_ids: Iterable[int]) -> "Learnset":
+        bits = 0
+        for move_id in move_ids:
+            bits |= 1 << move_id
+        return Learnset(bits)
+
+    @staticmethod
+    def from_moves(moves: Iterable["data.IntoMove"]) -> "Learnset":
+        return Learnset.from_ids(data.move_id(move) for move in moves)
+
+    def move_ids(self) -> array:
+        """The move ids in ascending order."""
+        ids = array("H")
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            ids.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return ids
+
+    def __contains__(self, move: object) -> bool:
+        if not isinstance(move, (Move, str)):
+            return False
+        try:
+            return bool(self._bits >> data.move_id(move) & 1)
+        except KeyError:
+            return False
+
+    def __iter__(self) -> Iterator[Move]:
+        moves = data._move_list()
+        return (moves[move_id] for move_id in self.move_ids())
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, Learnset) and self._bits == value._bits
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+    def __or__(self, other: "Learnset") -> "Learnset":
+        return Learnset(self._bits | other._bits)
+
+    def __and__(self, other: "Learnset") -> "Learnset":
+        return Learnset(self._bits & other._bits)
+
+    def __sub__(self, other: "Learnset") -> "Learnset":
+        return Learnset(self._bits & ~other._bits)
+
+    def union(self, *others: "Learnset") -> "Learnset":
+        bits = self._bits
+        for other in others:
+            bits |= other._bits
+        return Learnset(bits)
+
+    def intersection(self, *others: "Learnset") -> "Learnset":
+        bits = self._bits
+        for other in others:
+            bits &= other._bits
+        return Learnset(bits)
+
+    def filter(self, predicate: Callable[[Move], bool]) -> "Learnset":
+        moves = data._move_list()
+        return Learnset.from_ids(
+            move_id for move_id in self.move_ids() if predicate(moves[move_id])
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -0,0 +1,137 @@
+"""
+On-disk learnset index, read through mmap.
+
+Layout (native byte order, which is part of the key):
+    header      magic, version, key, species count, length of the names blob
+    names       species ids joined by newlines
+    offsets     uint32 per species plus one, indexing into `moves`
+    moves       uint16 move ids, species by species
+
+A move id is the position of the move in moves.json, so the index is only valid
+for the moves.json and learnsets.json it was built from.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from pokemon_damage_calculator.data.snapshot import (
+    SNAPSHOT_DIR,
+    code_hash,
+    source_stamp,
+)
+
+INDEX_VERSION = 1
+INDEX_PATH = SNAPSHOT_DIR / "learnsets.idx"
+
+_MAGIC = b"PDCL"
+_HEADER = struct.Struct("=4sI32sII")
+
+logger = logging.getLogger()
+
+
+def _key(learnsets_source: str, moves_source: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        str(INDEX_VERSION),
+        sys.byteorder,
+        source_stamp(learnsets_source),
+        source_stamp(moves_source),
+        code_hash(),
+    ):
+        digest.update(part.encode())
+    return digest.hexdigest().encode()
+
+
+def write_learnset_index(
+    learnsets: dict[str, list[str]],
+    move_order: list[str],
+    learnsets_source: str,
+    moves_source: str,
+    path: Path = INDEX_PATH,
+) -> Path:
+    move_ids = {move: i for i, move in enumerate(move_order)}
+    names = "\n".join(learnsets).encode()
+    offsets = array("I", [0])
+    moves = array("H")
+    for learnset in learnsets.values():
+        moves.extend(sorted(move_ids[move] for move in learnset))
+        offsets.append(len(moves))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                INDEX_VERSION,
+                _key(learnsets_source, moves_source),
+                len(learnsets),
+                len(names),
+            )
+        )
+        f.write(names)
+        f.write(b"\0" * (-f.tell() % offsets.itemsize))
+        f.write(offsets.tobytes())
+        f.write(moves.tobytes())
+    os.replace(temp, path)
+    return path
+
+
+class LearnsetIndex:
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.key, count, names_length = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {INDEX_VERSION} learnset index")
+
+        names_start = _HEADER.size
+        offsets_start = names_start + names_length
+        offsets_start += -offsets_start % 4
+        names = self._map[names_start : names_start + names_length].decode()
+        self._species = {name: i for i, name in enumerate(names.split("\n"))}
+        self._offsets = array(
+            "I", self._map[offsets_start : offsets_start + 4 * (count + 1)]
+        )
+        self._moves_start = offsets_start + 4 * (count + 1)
+
+    def __contains__(self, species: str) -> bool:
+        return species in self._species
+
+    def __len__(self) -> int:
+        return len(self._species)
+
+    def move_ids(self, species: str) -> array:
+        """Sorted move ids of `species`. Raises KeyError for unknown species."""
+        i = self._species[species]
+        start = self._moves_start + 2 * self._offsets[i]
+        end = self._moves_start + 2 * self._offsets[i + 1]
+        return array("H", self._map[start:end])
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def open_learnset_index(
+    learnsets_source: str, moves_source: str, path: Path = INDEX_PATH
+) -> Optional[LearnsetIndex]:
+    """The index at `path` if it matches the given sources, otherwise None."""
+    try:
+        index = LearnsetIndex(path)
+    except FileNotFoundError:
+        return None
+    except (ValueError, struct.error) as e:
+        logger.info("Learnset index %s is unreadable: %s", path, e)
+        return None
+    if index.key != _key(learnsets_source, moves_source):
+        logger.info("Learnset index %s is stale", path)
+        index.close()
+        return None
+    return index
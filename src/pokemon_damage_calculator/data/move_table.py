@@ -0,0 +1,81 @@
+"""
+The move table as columns for filtering all of it at once, with numpy (the
+`numpy` extra).
+
+Rows are in moves.json order, so a row is the move's id, as for `get_move`.
+"""
+
+from functools import cache
+from typing import Iterable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "pokemon_damage_calculator.data.move_table needs numpy, "
+        "install pokemon-damage-calculator[numpy]"
+    ) from e
+
+from pokemon_damage_calculator import data
+from pokemon_damage_calculator.model.enums import MoveCategory, MoveFlag, PokemonType
+from pokemon_damage_calculator.model.models import Move, flag_bits
+
+_CATEGORIES = list(MoveCategory)
+_TYPES = list(PokemonType)
+
+
+class MoveTable:
+    """Flag bits, category, type and base power of each move as arrays."""
+
+    def __init__(self, moves: Sequence[Move]) -> None:
+        self.moves = list(moves)
+        self.flags = np.array([m.flags for m in self.moves], dtype=np.uint64)
+        self.category = np.array(
+            [_CATEGORIES.index(m.category) for m in self.moves], dtype=np.int8
+        )
+        self.type = np.array([_TYPES.index(m.type) for m in self.moves], dtype=np.int8)
+        self.base_power = np.array([m.basePower for m in self.moves], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def mask(
+        self,
+        flags: Iterable[MoveFlag] = (),
+        without: Iterable[MoveFlag] = (),
+        category: Optional[MoveCategory] = None,
+        type: Optional[PokemonType] = None,
+    ) -> np.ndarray:
+        """
+        Which moves have all of `flags`, none of `without`, and the category and
+        type if given.
+        """
+        required = np.uint64(flag_bits(flags))
+        excluded = np.uint64(flag_bits(without))
+        result = (self.flags & required) == required
+        if excluded:
+            result &= (self.flags & excluded) == 0
+        if category is not None:
+            result &= self.category == _CATEGORIES.index(category)
+        if type is not None:
+            result &= self.type == _TYPES.index(type)
+        return result
+
+    def select(self, mask: np.ndarray) -> list[Move]:
+        return [self.moves[i] for i in np.flatnonzero(mask)]
+
+    def query(
+        self,
+        flags: Iterable[MoveFlag] = (),
+        without: Iterable[MoveFlag] = (),
+        category: Optional[MoveCategory] = None,
+        type: Optional[PokemonType] = None,
+    ) -> list[Move]:
+        """The moves `mask` picks out."""
+        return self.select(self.mask(flags, without, category, type))
+
+
+@cache
+def move_table() -> MoveTable:
+    """Every move in moves.json."""
+    return MoveTable(data._move_list())
@@ -0,0 +1,56 @@
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from pokemon_damage_calculator.utils import clean_name
+
+
+class NameIndex:
+    """
+    Resolves names to dense ids (positions in the source table). Every record is
+    reachable by its table key, its display name and its cleaned display name
+    without normalising the input; anything else goes through `clean_name`.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        """`entries` are (table key, display name) pairs in table order."""
+        self._ids: dict[str, int] = {}
+        prefixes: set[tuple[str, int]] = set()
+        for i, (key, name) in enumerate(entries):
+            for alias in (key, name, clean_name(name)):
+                self._ids.setdefault(alias, i)
+            prefixes.add((key, i))
+            prefixes.add((clean_name(name), i))
+        self._prefixes = sorted(prefixes)
+
+    def resolve(self, name: str) -> int:
+        """Raises KeyError for unknown names."""
+        try:
+            return self._ids[name]
+        except KeyError:
+            # Spellings aren't added to the index, so arbitrary input can't grow it
+            return self._ids[clean_name(name)]
+
+    def resolve_many(self, names: Iterable[str]) -> list[int]:
+        ids = self._ids
+        return [ids[name] if name in ids else self.resolve(name) for name in names]
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> list[int]:
+        """Ids of every record whose key or cleaned name starts with `prefix`."""
+        prefix = clean_name(prefix)
+        result: list[int] = []
+        seen: set[int] = set()
+        start = bisect_left(self._prefixes, (prefix, -1))
+        for alias, i in self._prefixes[start:]:
+            if not alias.startswith(prefix) or len(result) == limit:
+                break
+            if i not in seen:
+                seen.add(i)
+                result.append(i)
+        return result
+
+    def __contains__(self, name: str) -> bool:
+        try:
+            self.resolve(name)
+        except KeyError:
+            return False
+        return True
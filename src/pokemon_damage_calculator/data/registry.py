@@ -0,0 +1,114 @@
+from functools import cache, cached_property
+
+from serde import from_dict, to_dict
+
+from pokemon_damage_calculator import data
+from pokemon_damage_calculator.data.learnset import Learnset
+from pokemon_damage_calculator.data.names import NameIndex
+from pokemon_damage_calculator.model.models import Move, NatureModel, Species
+
+LATEST_GEN = 9
+
+# Fields of a species.json override that change anything we model.
+_SPECIES_OVERRIDES = {"types", "baseStats", "abilities", "weightkg"}
+
+
+def _override_species(species: Species, override: dict) -> Species:
+    changes = {k: v for k, v in override.items() if k in _SPECIES_OVERRIDES}
+    if not changes:
+        return species
+    return from_dict(Species, to_dict(species) | changes)
+
+
+class Dataset:
+    """
+    The tables of one generation, each built the first time it is used.
+
+    The latest generation is the plain data tables. An older generation is the
+    one after it with that generation's species.json overrides applied, so records
+    that don't change between generations are the same objects. Moves and
+    learnsets only exist for the latest generation and are shared by all of them.
+
+    Nothing is removed going back: an older generation still has every species
+    (`get_dataset(1).get_species("Iron Hands")` resolves) and, before natures
+    existed, the natures of the first generation that has them.
+    """
+
+    def __init__(self, gen: int) -> None:
+        self.gen = gen
+
+    @cached_property
+    def _parent(self) -> "Dataset | None":
+        return get_dataset(self.gen + 1) if self.gen < LATEST_GEN else None
+
+    @cached_property
+    def pokedex(self) -> dict[str, Species]:
+        if self._parent is None:
+            return data._load_pokedex()
+        overrides = data._load_species_overrides().get(str(self.gen), {})
+        pokedex = self._parent.pokedex
+        if not overrides:
+            return pokedex
+        return {
+            key: _override_species(species, overrides[key])
+            if key in overrides
+            else species
+            for key, species in pokedex.items()
+        }
+
+    @cached_property
+    def _species_list(self) -> list[Species]:
+        return list(self.pokedex.values())
+
+    @property
+    def moves(self) -> dict[str, Move]:
+        return data._load_moves()
+
+    @cached_property
+    def natures(self) -> dict[str, NatureModel]:
+        natures = data._load_natures().get(str(self.gen))
+        if natures is None and self._parent is not None:
+            return self._parent.natures
+        return natures or {}
+
+    @cached_property
+    def _nature_list(self) -> list[NatureModel]:
+        return list(self.natures.values())
+
+    @cached_property
+    def _nature_names(self) -> NameIndex:
+        if self._parent is None:
+            return data._nature_names()
+        if self.natures is self._parent.natures:
+            return self._parent._nature_names
+        return NameIndex((key, nature.name) for key, nature in self.natures.items())
+
+    def get_species(self, species_name: str) -> Species:
+        return self._species_list[data._species_names().resolve(species_name)]
+
+    def get_move(self, move_name: str) -> Move:
+        return data.get_move(move_name)
+
+    def get_nature(self, nature_name: str) -> NatureModel:
+        return self._nature_list[self._nature_names.resolve(nature_name)]
+
+    def get_learnset(self, species: "data.IntoSpecies") -> Learnset:
+        return data.get_learnset(self.into_species(species))
+
+    def into_move(self, move: "data.IntoMove") -> Move:
+        return data.into_move(move)
+
+    def into_species(self, species: "data.IntoSpecies") -> Species:
+        if isinstance(species, str):
+            return self.get_species(species)
+        return species
+
+    def __repr__(self) -> str:
+        return f"<Dataset gen {self.gen}>"
+
+
+@cache
+def get_dataset(gen: int) -> Dataset:
+    if not 1 <= gen <= LATEST_GEN:
+        raise ValueError(f"No data for generation {gen}")
+    return Dataset(gen)
@@ -0,0 +1,78 @@
+"""
+Binary snapshots of the decoded data tables.
+
+A snapshot is a pickle of a table as it comes out of pyserde, stored next to the
+JSON it was built from. It is only used if it was written by the same snapshot
+version from the same JSON, going by its size and modification time, and the
+same model and parser code; otherwise the caller falls back to parsing the JSON.
+"""
+
+from functools import cache
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+from pokemon_damage_calculator.model import enums, models
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = Path("data/.snapshot")
+
+logger = logging.getLogger()
+
+
+def source_stamp(path: str | Path) -> str:
+    """The size and modification time of `path`, cheaper to check than a hash."""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+@cache
+def code_hash() -> str:
+    """
+    Hash of the code a table's snapshot depends on: the model modules, as
+    pickles reference their classes, and the parsers in data/__init__.py.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    parsers = Path(__file__).with_name("__init__.py")
+    for path in (models.__file__, enums.__file__, parsers):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _key(source: str) -> tuple[int, str, str]:
+    return (SNAPSHOT_VERSION, source_stamp(source), code_hash())
+
+
+def snapshot_path(source: str) -> Path:
+    return SNAPSHOT_DIR / (Path(source).stem + ".pickle")
+
+
+def load_snapshot(source: str) -> Optional[Any]:
+    """The table snapshotted from `source`, or None if there is no valid snapshot."""
+    path = snapshot_path(source)
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) != _key(source):
+                logger.info("Snapshot %s is stale", path)
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.info("Snapshot %s is unreadable: %s", path, e)
+        return None
+
+
+def write_snapshot(source: str, table: Any) -> Path:
+    path = snapshot_path(source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+        pickle.dump(_key(source), f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, path)
+    return path
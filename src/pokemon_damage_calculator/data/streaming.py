@@ -0,0 +1,101 @@
+"""
+Incremental reader for learnsets.json.
+
+The file is memory-mapped and walked token by token, so the JSON text is never
+held as one string and nothing is built for the keys we don't use (eventData,
+encounters, eventOnly, ...); only species ids and move ids are decoded.
+"""
+
+import mmap
+import re
+from typing import Iterator
+
+_WHITESPACE = re.compile(rb"\s*")
+_STRING = rb'"((?:[^"\\]|\\.)*)"'
+_SCALAR = re.compile(_STRING + rb"|[^,}\]\s]*")
+_KEY = re.compile(rb"\s*" + _STRING + rb"\s*:\s*")
+# A learnset maps move ids (always lowercase alphanumeric) to arrays of source
+# strings, so it never nests braces.
+_LEARNSET = re.compile(rb"\{[^{}]*\}")
+_LEARNSET_KEY = re.compile(rb'"([a-z0-9]+)"\s*:')
+_SKIPPED_TOKEN = re.compile(_STRING + rb"|[\[\]{}]")
+
+
+class _Walker:
+    def __init__(self, buffer: mmap.mmap) -> None:
+        self.buffer = buffer
+        self.pos = 0
+
+    def error(self, expected: str) -> ValueError:
+        return ValueError(f"Expected {expected} at byte {self.pos}")
+
+    def peek(self) -> bytes:
+        self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+        return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char:
+            raise self.error(repr(char))
+        self.pos += 1
+
+    def next_member(self, first: bool) -> bool:
+        """Step over the separator before an object member, False at the end."""
+        if self.peek() == b"}":
+            self.pos += 1
+            return False
+        if not first:
+            self.expect(b",")
+        return True
+
+    def key(self) -> str:
+        match = _KEY.match(self.buffer, self.pos)
+        if match is None:
+            raise self.error("an object key")
+        self.pos = match.end()
+        return match.group(1).decode()
+
+    def skip_value(self) -> None:
+        if self.peek() not in (b"{", b"["):
+            self.pos = _SCALAR.match(self.buffer, self.pos).end()  # type: ignore
+            return
+        depth = 0
+        for token in _SKIPPED_TOKEN.finditer(self.buffer, self.pos):
+            if token.group() in (b"{", b"["):
+                depth += 1
+            elif token.group() in (b"}", b"]"):
+                depth -= 1
+            if depth == 0:
+                self.pos = token.end()
+                return
+        raise self.error("the end of a value")
+
+    def learnset(self) -> list[str]:
+        match = _LEARNSET.match(self.buffer, self.pos)
+        if match is None:
+            raise self.error("a learnset")
+        self.pos = match.end()
+        return [key.decode() for key in _LEARNSET_KEY.findall(match.group())]
+
+
+def iter_learnsets(path: str) -> Iterator[tuple[str, list[str]]]:
+    """(species id, move ids) for every species in learnsets.json, in file order."""
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+    ):
+        walker = _Walker(buffer)
+        walker.expect(b"{")
+        first_species = True
+        while walker.next_member(first_species):
+            first_species = False
+            species = walker.key()
+            moves: list[str] = []
+            walker.expect(b"{")
+            first_key = True
+            while walker.next_member(first_key):
+                first_key = False
+                if walker.key() == "learnset" and walker.peek() == b"{":
+                    moves = walker.learnset()
+                else:
+                    walker.skip_value()
+            yield species, moves
@@ -25,6 +25,13 @@ class Stat(Enum):
     SpecialDefence = "spd"
     Speed = "spe"
 
+    ordinal: int
+    """Dense index (0-5) in declaration order, for array-backed stat storage"""
+
+
+for _ordinal, _stat in enumerate(Stat):
+    _stat.ordinal = _ordinal
+
 
 class Ability(Enum):
     NoAbility = ""
@@ -388,6 +395,13 @@ class MoveFlag(Enum):
     FailEncore = "failencore"
     Dance = "dance"
 
+    bit: int
+    """This flag's bit of `Move.flags`"""
+
+
+for _bit, _flag in enumerate(MoveFlag):
+    _flag.bit = 1 << _bit
+
 
 class IsNonStandard(Enum):
     LGPE = "LGPE"
@@ -6,7 +6,7 @@ from pokemon_damage_calculator.calc.base_power_callbacks import (
     heavy_slam,
     low_kick,
 )
-from pokemon_damage_calculator.calc.utils import pokemon_round
+from pokemon_damage_calculator.calc.utils import apply_modifier
 from pokemon_damage_calculator.model.enums import (
     Ability,
     MoveCategory,
@@ -15,15 +15,14 @@ from pokemon_damage_calculator.model.enums import (
     Stat,
     Status,
     Terrain,
-    TypeMatchup,
     UniqueOffensivePokemon,
     Weather,
 )
 
-from typing import TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
-from pokemon_damage_calculator.model.models import Move
-from pokemon_damage_calculator.utils import TYPE_CHART
+from pokemon_damage_calculator.model import type_chart
+from pokemon_damage_calculator.model.models import Move, MoveFeature
 
 if TYPE_CHECKING:
     from pokemon_damage_calculator.calc.pokemon import Pokemon
@@ -32,42 +31,137 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger()
 
+type _EnterHook = Callable[["Pokemon", "GameState"], None]
+type _StatHook = Callable[["Pokemon", "GameState", Stat], float]
+type _PowerHook = Callable[["Pokemon", "_MoveDetails"], Optional[_ChainMultiplier]]
+type _FieldHook = Callable[
+    ["Pokemon", "_MoveDetails", "GameState"], Optional[_ChainMultiplier]
+]
+type _TargetHook = Callable[["_MoveDetails"], Optional[_ChainMultiplier]]
+type _ModifierHook = Callable[["Pokemon", "_MoveDetails", "GameState"], Optional[int]]
+type _DefenceHook = Callable[
+    ["Pokemon", "Pokemon", Stat, "GameState"], Optional[_ChainMultiplier]
+]
+type _ImmunityHook = Callable[["_MoveDetails", float], bool]
+
+
+@dataclass
+class AbilityHooks:
+    """
+    What an ability does at each stage, None for the stages it takes no part
+    in. A stage only calls the hooks of the abilities that are present.
+    """
+
+    on_enter: Optional[_EnterHook] = None
+    stat: Optional[_StatHook] = None
+    """Multiplier of the pokemon's raw stat"""
+    power: Optional[_PowerHook] = None
+    """The attacker's power modifier that doesn't depend on the field"""
+    field_power: Optional[_FieldHook] = None
+    """The attacker's power modifier that does"""
+    target_power: Optional[_TargetHook] = None
+    attack_modifier: Optional[_ModifierHook] = None
+    """Applied to the attacker's attack stat before the chain"""
+    attack: Optional[_FieldHook] = None
+    target_attack: Optional[_TargetHook] = None
+    defence: Optional[_DefenceHook] = None
+    """Called with (target, attacker, defence stat, game state)"""
+    immunity: Optional[_ImmunityHook] = None
+    """Whether the target is immune, given the move's type effectiveness"""
+
+
+ABILITY_HOOKS: dict[Ability, AbilityHooks] = {}
+"""Every ability that does something, and what"""
+
+_NO_HOOKS = AbilityHooks()
+
+
+def ability_hooks(ability: Ability) -> AbilityHooks:
+    return ABILITY_HOOKS.get(ability, _NO_HOOKS)
+
+
+def _hook(stage: str, *abilities: Ability):
+    """Registers the decorated function as the `stage` hook of `abilities`."""
+
+    def register(hook):
+        for ability in abilities:
+            hooks = ABILITY_HOOKS.setdefault(ability, AbilityHooks())
+            assert getattr(hooks, stage) is None, f"{ability} has two {stage} hooks"
+            setattr(hooks, stage, hook)
+        return hook
+
+    return register
+
+
+# Entry effects
+
+_TERRAIN_SETTERS = {
+    Ability.GrassySurge: Terrain.Grassy,
+    Ability.ElectricSurge: Terrain.Electric,
+    Ability.PsychicSurge: Terrain.Psychic,
+    Ability.MistySurge: Terrain.Misty,
+}
+_PRIMAL_WEATHER_SETTERS = {
+    Ability.DesolateLand: Weather.ExtremelyHarshSunlight,
+    Ability.PrimordialSea: Weather.HeavyRain,
+    Ability.DeltaStream: Weather.StrongWinds,
+}
+_WEATHER_SETTERS = {
+    Ability.Drought: Weather.SunnyDay,
+    Ability.OrichalcumPulse: Weather.SunnyDay,
+    Ability.Drizzle: Weather.RainDance,
+}
+
+
+def _sets_terrain(terrain: Terrain) -> _EnterHook:
+    def on_enter(pokemon: "Pokemon", game_state: "GameState"):
+        game_state.terrain = terrain
+
+    return on_enter
+
+
+def _sets_weather(weather: Weather, primal: bool) -> _EnterHook:
+    def on_enter(pokemon: "Pokemon", game_state: "GameState"):
+        if primal or not game_state.weather.difficult_to_override():
+            game_state.weather = weather
+
+    return on_enter
+
+
+for _ability, _terrain in _TERRAIN_SETTERS.items():
+    _hook("on_enter", _ability)(_sets_terrain(_terrain))
+for _ability, _weather in _PRIMAL_WEATHER_SETTERS.items():
+    _hook("on_enter", _ability)(_sets_weather(_weather, primal=True))
+for _ability, _weather in _WEATHER_SETTERS.items():
+    _hook("on_enter", _ability)(_sets_weather(_weather, primal=False))
+
+
+@_hook("on_enter", Ability.DauntlessShield)
+def _dauntless_shield(pokemon: "Pokemon", game_state: "GameState"):
+    apply_boost(pokemon, game_state, Stat.Defence, 1, False)
+
+
+@_hook("on_enter", Ability.IntrepidSword)
+def _intrepid_sword(pokemon: "Pokemon", game_state: "GameState"):
+    apply_boost(pokemon, game_state, Stat.Attack, 1, False)
+
+
+@_hook("on_enter", Ability.Intimidate)
+def _intimidate(pokemon: "Pokemon", game_state: "GameState"):
+    for p in game_state.get_hostile(pokemon):
+        apply_boost(p, game_state, Stat.Attack, -1, True)
+
 
 def enters_effects(pokemon: "Pokemon", game_state: "GameState"):
-    # Terrain
-    match pokemon.ability:
-        case Ability.GrassySurge:
-            game_state.terrain = Terrain.Grassy
-        case Ability.ElectricSurge:
-            game_state.terrain = Terrain.Electric
-        case Ability.PsychicSurge:
-            game_state.terrain = Terrain.Psychic
-        case Ability.MistySurge:
-            game_state.terrain = Terrain.Misty
-
-    # Weather
-    match pokemon.ability:
-        case Ability.DesolateLand:
-            game_state.weather = Weather.ExtremelyHarshSunlight
-        case Ability.PrimordialSea:
-            game_state.weather = Weather.HeavyRain
-        case Ability.DeltaStream:
-            game_state.weather = Weather.StrongWinds
-        case Ability.Drought if not game_state.weather.difficult_to_override():
-            game_state.weather = Weather.SunnyDay
-        case Ability.OrichalcumPulse if not game_state.weather.difficult_to_override():
-            game_state.weather = Weather.SunnyDay
-        case Ability.Drizzle if not game_state.weather.difficult_to_override():
-            game_state.weather = Weather.RainDance
+    on_enter = ability_hooks(pokemon.ability).on_enter
+    if on_enter is not None:
+        on_enter(pokemon, game_state)
 
-    # Other
-    match pokemon.ability:
-        case Ability.DauntlessShield:
-            apply_boost(pokemon, game_state, Stat.Defence, 1, False)
-        case Ability.IntrepidSword:
-            apply_boost(pokemon, game_state, Stat.Attack, 1, False)
-        case Ability.Intimidate:
-            [apply_boost(p, game_state, Stat.Attack, -1, True) for p in game_state.get_hostile(pokemon)]
+
+ENTRY_ABILITIES = frozenset(
+    ability for ability, hooks in ABILITY_HOOKS.items() if hooks.on_enter is not None
+)
+"""Abilities `enters_effects` acts on"""
 
 
 def apply_boost(
@@ -86,6 +180,7 @@ def apply_boost(
             case Ability.Competitive:
                 apply_boost(pokemon, game_state, Stat.SpecialAttack, 2, False)
     pokemon.boosts[stat] = min(max(pokemon.boosts[stat] + stages * contrary_multiplier, -6), 6)
+    pokemon.invalidate_stats()
 
 
 @dataclass
@@ -96,6 +191,11 @@ class _ChainMultiplier:
     """Lowest first"""
 
 
+def _append(chain: list[_ChainMultiplier], multiplier: Optional[_ChainMultiplier]):
+    if multiplier is not None:
+        chain.append(multiplier)
+
+
 def _resolve_chain(value: int, chain: list[_ChainMultiplier]) -> int:
     combined_multiplier = 4096
 
@@ -104,7 +204,7 @@ def _resolve_chain(value: int, chain: list[_ChainMultiplier]) -> int:
     for mult in chain:
         combined_multiplier = round(combined_multiplier * mult.numerator / 4096)
 
-    return pokemon_round(value * combined_multiplier / 4096)
+    return apply_modifier(value, combined_multiplier)
 
 
 def calc_base_power(
@@ -129,12 +229,7 @@ def calc_base_power(
     return basePower
 
 
-def calc_move_type(
-    attacker: "Pokemon",
-    target: "Pokemon",
-    move: Move,
-    game_state: "GameState",
-) -> PokemonType:
+def calc_move_type(attacker: "Pokemon", move: Move) -> PokemonType:
     altered_move_type = move.type
     match attacker.ability:
         case Ability.Aerilate if altered_move_type == PokemonType.Normal:
@@ -163,6 +258,27 @@ def calc_move_type(
     return altered_move_type
 
 
+@dataclass(frozen=True)
+class Auras:
+    """Which of the field's pokemon have Fairy Aura, Dark Aura and Aura Break."""
+
+    fairy: bool
+    dark: bool
+    aura_break: bool
+
+
+AURA_ABILITIES = frozenset({Ability.FairyAura, Ability.DarkAura, Ability.AuraBreak})
+
+
+def calc_auras(game_state: "GameState") -> Auras:
+    abilities = {pokemon.ability for pokemon in game_state.pokemon}
+    return Auras(
+        fairy=Ability.FairyAura in abilities,
+        dark=Ability.DarkAura in abilities,
+        aura_break=Ability.AuraBreak in abilities,
+    )
+
+
 class _EffectivePowerMults:
     AURA_BREAK = _ChainMultiplier(3072, 1)
     RIVALRY = _ChainMultiplier(3072, 2)
@@ -187,129 +303,180 @@ class _EffectivePowerMults:
     SPORT = _ChainMultiplier(1352, 21)
 
 
+@_hook(
+    "power", Ability.Aerilate, Ability.Galvanize, Ability.Pixilate, Ability.Refrigerate
+)
+def _normal_type_change(attacker: "Pokemon", move: "_MoveDetails"):
+    if move.base_move.type == PokemonType.Normal:
+        return _EffectivePowerMults.ONE_TWO_ABILITY
+
+
+# TODO analytic
+# TODO Battery
+
+
+@_hook("power", Ability.FlareBoost)
+def _flare_boost(attacker: "Pokemon", move: "_MoveDetails"):
+    if (
+        attacker.status == Status.Burn
+        and move.base_move.category == MoveCategory.Special
+    ):
+        return _EffectivePowerMults.ONE_FIVE_ABILITY
+
+
+_FLAG_POWER_BOOSTS = {
+    Ability.IronFist: (MoveFlag.Punch, _EffectivePowerMults.ONE_TWO_ABILITY),
+    Ability.MegaLauncher: (MoveFlag.Pulse, _EffectivePowerMults.ONE_FIVE_ABILITY),
+    Ability.PunkRock: (MoveFlag.Sound, _EffectivePowerMults.ONE_THREE_ABILITY),
+    Ability.Sharpness: (MoveFlag.Slicing, _EffectivePowerMults.ONE_FIVE_ABILITY),
+    Ability.StrongJaw: (MoveFlag.Bite, _EffectivePowerMults.ONE_FIVE_ABILITY),
+}
+
+
+def _boosts_flag(flag: MoveFlag, multiplier: _ChainMultiplier) -> _PowerHook:
+    def power(attacker: "Pokemon", move: "_MoveDetails"):
+        if move.base_move.has_flag(flag):
+            return multiplier
+
+    return power
+
+
+for _ability, (_flag, _multiplier) in _FLAG_POWER_BOOSTS.items():
+    _hook("power", _ability)(_boosts_flag(_flag, _multiplier))
+
+
+@_hook("power", Ability.Normalize)
+def _normalize(attacker: "Pokemon", move: "_MoveDetails"):
+    return _EffectivePowerMults.ONE_TWO_ABILITY
+
+
+@_hook("power", Ability.Reckless)
+def _reckless(attacker: "Pokemon", move: "_MoveDetails"):
+    if move.base_move.recoil or move.base_move.hasCrashDamage:
+        return _EffectivePowerMults.ONE_TWO_ABILITY
+
+
+# TODO Rivalry
+
+
+@_hook("power", Ability.SheerForce)
+def _sheer_force(attacker: "Pokemon", move: "_MoveDetails"):
+    if move.base_move.hasSheerForce:
+        return _EffectivePowerMults.ONE_THREE_ABILITY
+
+
+@_hook("power", Ability.ToughClaws)
+def _tough_claws(attacker: "Pokemon", move: "_MoveDetails"):
+    if move.contact:
+        return _EffectivePowerMults.ONE_THREE_ABILITY
+
+
+@_hook("power", Ability.ToxicBoost)
+def _toxic_boost(attacker: "Pokemon", move: "_MoveDetails"):
+    if (
+        attacker.status == Status.Poison or attacker.status == Status.Toxic
+    ) and move.base_move.category == MoveCategory.Physical:
+        return _EffectivePowerMults.ONE_FIVE_ABILITY
+
+
+@_hook("field_power", Ability.SandForce)
+def _sand_force(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    if game_state.weather == Weather.Sandstorm and move.type in [
+        PokemonType.Rock,
+        PokemonType.Ground,
+        PokemonType.Steel,
+    ]:
+        return _EffectivePowerMults.ONE_THREE_ABILITY
+
+
+@_hook("target_power", Ability.DrySkin)
+def _dry_skin_power(move: "_MoveDetails"):
+    if move.type == PokemonType.Fire:
+        return _EffectivePowerMults.DRY_SKIN
+
+
+@_hook("target_power", Ability.Heatproof)
+def _heatproof(move: "_MoveDetails"):
+    if move.type == PokemonType.Fire:
+        return _EffectivePowerMults.HEATPROOF
+
+
+def calc_attacker_power_mults(
+    attacker: "Pokemon", move: "_MoveDetails"
+) -> list[_ChainMultiplier]:
+    """The attacker's ability's power modifiers that don't depend on the field."""
+    power = ability_hooks(attacker.ability).power
+    multiplier = power(attacker, move) if power is not None else None
+    return [multiplier] if multiplier is not None else []
+
+
 def calc_effective_power(
     attacker: "Pokemon",
     target: "Pokemon",
     move: "_MoveDetails",
     game_state: "GameState",
     base_power: int,
+    attacker_mults: Optional[list[_ChainMultiplier]] = None,
 ) -> int:
     chain: list[_ChainMultiplier] = []
 
     # Auras
-    fairy_aura = any(
-        pokemon.ability == Ability.FairyAura for pokemon in game_state.pokemon
-    )
-    dark_aura = any(
-        pokemon.ability == Ability.DarkAura for pokemon in game_state.pokemon
-    )
-    aura_break = any(
-        pokemon.ability == Ability.AuraBreak for pokemon in game_state.pokemon
-    )
-    if aura_break and (
-        (fairy_aura and move.type == PokemonType.Fairy)
-        or (dark_aura and move.type == PokemonType.Dark)
+    auras = move.auras
+    if auras.aura_break and (
+        (auras.fairy and move.type == PokemonType.Fairy)
+        or (auras.dark and move.type == PokemonType.Dark)
     ):
         chain.append(_EffectivePowerMults.AURA_BREAK)
-    elif dark_aura and move.type == PokemonType.Dark:
+    elif auras.dark and move.type == PokemonType.Dark:
         chain.append(_EffectivePowerMults.AURA)
-    elif fairy_aura and move.type == PokemonType.Fairy:
+    elif auras.fairy and move.type == PokemonType.Fairy:
         chain.append(_EffectivePowerMults.AURA)
 
     # Attacker abiltiies
-    match attacker.ability:
-        case Ability.Aerilate if move.base_move.type == PokemonType.Normal:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        # TODO analytic
-        # TODO Battery
-        case Ability.FlareBoost if (
-            attacker.status == Status.Burn
-            and move.base_move.category == MoveCategory.Special
-        ):
-            chain.append(_EffectivePowerMults.ONE_FIVE_ABILITY)
-        case Ability.IronFist if move.base_move.has_flag(MoveFlag.Punch):
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        case Ability.Galvanize if move.base_move.type == PokemonType.Normal:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        case Ability.MegaLauncher if move.base_move.has_flag(MoveFlag.Pulse):
-            chain.append(_EffectivePowerMults.ONE_FIVE_ABILITY)
-        case Ability.Normalize:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        case Ability.Pixilate if move.base_move.type == PokemonType.Normal:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        case Ability.Reckless if move.base_move.recoil or move.base_move.hasCrashDamage:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        case Ability.PunkRock if move.base_move.has_flag(MoveFlag.Sound):
-            chain.append(_EffectivePowerMults.ONE_THREE_ABILITY)
-        case Ability.Refrigerate if move.base_move.type == PokemonType.Normal:
-            chain.append(_EffectivePowerMults.ONE_TWO_ABILITY)
-        # TODO Rivalry
-        case Ability.SandForce if (
-            game_state.weather == Weather.Sandstorm
-            and move.type in [PokemonType.Rock, PokemonType.Ground, PokemonType.Steel]
-        ):
-            chain.append(_EffectivePowerMults.ONE_THREE_ABILITY)
-        case Ability.Sharpness if move.base_move.has_flag(MoveFlag.Slicing):
-            chain.append(_EffectivePowerMults.ONE_FIVE_ABILITY)
-        case Ability.SheerForce if move.base_move.hasSheerForce:
-            chain.append(_EffectivePowerMults.ONE_THREE_ABILITY)
-        case Ability.StrongJaw if move.base_move.has_flag(MoveFlag.Bite):
-            chain.append(_EffectivePowerMults.ONE_FIVE_ABILITY)
-        case Ability.ToughClaws if move.contact:
-            chain.append(_EffectivePowerMults.ONE_THREE_ABILITY)
-        case Ability.ToxicBoost if (
-            attacker.status == Status.Poison or attacker.status == Status.Toxic
-        ) and move.base_move.category == MoveCategory.Physical:
-            chain.append(_EffectivePowerMults.ONE_FIVE_ABILITY)
+    if attacker_mults is None:
+        attacker_mults = calc_attacker_power_mults(attacker, move)
+    chain.extend(attacker_mults)
+    field_power = ability_hooks(attacker.ability).field_power
+    if field_power is not None:
+        _append(chain, field_power(attacker, move, game_state))
 
     # Defender abilities
     if not move.ignores_ability:
-        match target.ability:
-            case Ability.DrySkin if move.type == PokemonType.Fire:
-                chain.append(_EffectivePowerMults.DRY_SKIN)
-            case Ability.Heatproof if move.type == PokemonType.Fire:
-                chain.append(_EffectivePowerMults.HEATPROOF)
+        target_power = ability_hooks(target.ability).target_power
+        if target_power is not None:
+            _append(chain, target_power(move))
 
     # Items
     # TODO
 
     # Moves
-    match move.base_move.name:
-        case "Brine" if target.current_hp <= math.floor(
-            target.stat(Stat.HP, game_state) / 2
-        ):
+    features = move.base_move.features
+    if features & MoveFeature.BRINE:
+        if target.current_hp <= math.floor(target.stat(Stat.HP, game_state) / 2):
             chain.append(_EffectivePowerMults.DOUBLE_MOVE)
-        case "Facade" if attacker.status is not None:
+    elif features & MoveFeature.FACADE:
+        if attacker.status is not None:
             chain.append(_EffectivePowerMults.DOUBLE_MOVE)
-        # TODO Fusion Bolt
-        # TODO Fusion FLare
-        # TODO Knock Off
-        # TODO Retaliate
-        case "Solar Beam" if game_state.weather not in [
+    # TODO Fusion Bolt
+    # TODO Fusion FLare
+    # TODO Knock Off
+    # TODO Retaliate
+    elif features & MoveFeature.SOLAR:
+        if game_state.weather not in [
             Weather.NONE,
             Weather.SunnyDay,
             Weather.ExtremelyHarshSunlight,
             Weather.StrongWinds,
         ]:
             chain.append(_EffectivePowerMults.SOLAR_BAD_WEATHER)
-        case "Solar Blade" if game_state.weather not in [
-            Weather.NONE,
-            Weather.SunnyDay,
-            Weather.ExtremelyHarshSunlight,
-            Weather.StrongWinds,
-        ]:
-            chain.append(_EffectivePowerMults.SOLAR_BAD_WEATHER)
-        case "Venoshock" if target.status in [Status.Poison, Status.Toxic]:
+    elif features & MoveFeature.VENOSHOCK:
+        if target.status in [Status.Poison, Status.Toxic]:
             chain.append(_EffectivePowerMults.DOUBLE_MOVE)
 
     # Terrains
     if target.is_grounded(move.ignores_ability):
         match game_state.terrain:
-            case Terrain.Grassy if move.base_move.name in [
-                "Earthquake",
-                "Bulldoze",
-                "Magnitude",
-            ]:
+            case Terrain.Grassy if features & MoveFeature.GROUND_SHAKING:
                 chain.append(_EffectivePowerMults.TERRAIN_DEFENCE)
             case Terrain.Misty if move.type == PokemonType.Dragon:
                 chain.append(_EffectivePowerMults.TERRAIN_DEFENCE)
@@ -354,6 +521,117 @@ class _EffectiveAttackMults:
     UNIQUE_ITEM_DOUBLERS = _ChainMultiplier(8192, 7)
 
 
+@_hook("attack_modifier", Ability.Hustle)
+def _hustle(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    return 6144
+
+
+@_hook("attack_modifier", Ability.HadronEngine)
+def _hadron_engine(
+    attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"
+):
+    if (
+        move.base_move.category == MoveCategory.Special
+        and game_state.terrain == Terrain.Electric
+    ):
+        return 5461
+
+
+@_hook("attack_modifier", Ability.OrichalcumPulse)
+def _orichalcum_pulse(
+    attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"
+):
+    if move.base_move.category == MoveCategory.Physical and game_state.weather in [
+        Weather.SunnyDay,
+        Weather.ExtremelyHarshSunlight,
+    ]:
+        return 5461
+
+
+_PINCH_ABILITIES = {
+    Ability.Blaze: PokemonType.Fire,
+    Ability.Overgrow: PokemonType.Grass,
+    Ability.Swarm: PokemonType.Bug,
+    Ability.Torrent: PokemonType.Water,
+}
+
+
+@_hook("attack", *_PINCH_ABILITIES)
+def _pinch(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    if move.type == _PINCH_ABILITIES[attacker.ability] and attacker.current_hp <= (
+        math.floor(attacker.stat(Stat.HP, game_state) / 3)
+    ):
+        return _EffectiveAttackMults.FIFTY_OFFENCE
+
+
+@_hook("attack", Ability.Defeatist)
+def _defeatist(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    if attacker.current_hp <= math.floor(attacker.stat(Stat.HP, game_state) / 2):
+        return _EffectiveAttackMults.HALF_OFFENCE
+
+
+# TODO Flash Fire
+# TODO Flower Gift
+# TODO Minus
+# TODO Plus
+
+_PHYSICAL_ATTACK_BOOSTS = {
+    Ability.GorillaTactics: _EffectiveAttackMults.FIFTY_OFFENCE,
+    Ability.HugePower: _EffectiveAttackMults.DOUBLE_OFFENCE,
+    Ability.PurePower: _EffectiveAttackMults.DOUBLE_OFFENCE,
+    Ability.SlowStart: _EffectiveAttackMults.HALF_OFFENCE,  # TODO Z-moves are weird
+}
+
+
+@_hook("attack", *_PHYSICAL_ATTACK_BOOSTS)
+def _physical_attack_boost(
+    attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"
+):
+    if move.base_move.category == MoveCategory.Physical:
+        return _PHYSICAL_ATTACK_BOOSTS[attacker.ability]
+
+
+@_hook("attack", Ability.Guts)
+def _guts(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    if attacker.status is not None:
+        return _EffectiveAttackMults.FIFTY_OFFENCE
+
+
+@_hook("attack", Ability.SolarPower)
+def _solar_power(attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"):
+    if move.base_move.category == MoveCategory.Special and game_state.weather in [
+        Weather.SunnyDay,
+        Weather.ExtremelyHarshSunlight,
+    ]:
+        return _EffectiveAttackMults.FIFTY_OFFENCE
+
+
+_TYPE_ATTACK_BOOSTS = {
+    Ability.DragonsMaw: (PokemonType.Dragon, _EffectiveAttackMults.FIFTY_OFFENCE),
+    Ability.RockyPayload: (PokemonType.Rock, _EffectiveAttackMults.FIFTY_OFFENCE),
+    # TODO Steely Spirit's ally
+    Ability.SteelySpirit: (PokemonType.Steel, _EffectiveAttackMults.FIFTY_OFFENCE),
+    Ability.Steelworker: (PokemonType.Steel, _EffectiveAttackMults.FIFTY_OFFENCE),
+    Ability.Transistor: (PokemonType.Electric, _EffectiveAttackMults.FIFTY_OFFENCE),
+    Ability.WaterBubble: (PokemonType.Water, _EffectiveAttackMults.DOUBLE_OFFENCE),
+}
+
+
+@_hook("attack", *_TYPE_ATTACK_BOOSTS)
+def _type_attack_boost(
+    attacker: "Pokemon", move: "_MoveDetails", game_state: "GameState"
+):
+    type_, multiplier = _TYPE_ATTACK_BOOSTS[attacker.ability]
+    if move.type == type_:
+        return multiplier
+
+
+@_hook("target_attack", Ability.PurifyingSalt)
+def _purifying_salt(move: "_MoveDetails"):
+    if move.type in [PokemonType.Ghost, PokemonType.Fire, PokemonType.Ice]:
+        return _EffectiveAttackMults.HALF_DEFENCE
+
+
 def calc_effective_attack(
     attacker: "Pokemon",
     target: "Pokemon",
@@ -383,105 +661,22 @@ def calc_effective_attack(
             # TODO boosts,
             pass
 
-    if attacker.ability == Ability.Hustle:
-        attack = pokemon_round(attack * 6144 / 4096)
-    if (
-        attacker.ability == Ability.HadronEngine
-        and move.base_move.category == MoveCategory.Special
-        and game_state.terrain == Terrain.Electric
-    ):
-        attack = pokemon_round(attack * 5461 / 4096)
-    if (
-        attacker.ability == Ability.OrichalcumPulse
-        and move.base_move.category == MoveCategory.Physical
-        and game_state.weather
-        in [
-            Weather.SunnyDay,
-            Weather.ExtremelyHarshSunlight,
-        ]
-    ):
-        attack = pokemon_round(attack * 5461 / 4096)
+    attacker_hooks = ability_hooks(attacker.ability)
+    if attacker_hooks.attack_modifier is not None:
+        modifier = attacker_hooks.attack_modifier(attacker, move, game_state)
+        if modifier is not None:
+            attack = apply_modifier(attack, modifier)
     chain: list[_ChainMultiplier] = []
 
     # Attacker Abilities
-    match attacker.ability:
-        case Ability.Blaze if (
-            move.type == PokemonType.Fire
-            and attacker.current_hp
-            <= math.floor(attacker.stat(Stat.HP, game_state) / 3)
-        ):
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.Defeatist if attacker.current_hp <= math.floor(
-            attacker.stat(Stat.HP, game_state) / 2
-        ):
-            chain.append(_EffectiveAttackMults.HALF_OFFENCE)
-        # TODO Flash Fire
-        # TODO Flower Gift
-        case Ability.GorillaTactics if move.base_move.category == MoveCategory.Physical:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.Guts if attacker.status is not None:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.HugePower if move.base_move.category == MoveCategory.Physical:
-            chain.append(_EffectiveAttackMults.DOUBLE_OFFENCE)
-        # TODO Minus
-        case Ability.Overgrow if (
-            move.type == PokemonType.Grass
-            and attacker.current_hp
-            <= math.floor(attacker.stat(Stat.HP, game_state) / 3)
-        ):
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        # TODO Plus
-        case Ability.PurePower if move.base_move.category == MoveCategory.Physical:
-            chain.append(_EffectiveAttackMults.DOUBLE_OFFENCE)
-        case Ability.SlowStart if (
-            move.base_move.category == MoveCategory.Physical
-        ):  # TODO Z-moves are weird
-            chain.append(_EffectiveAttackMults.HALF_OFFENCE)
-        case Ability.SolarPower if (
-            move.base_move.category == MoveCategory.Special
-            and game_state.weather
-            in [
-                Weather.SunnyDay,
-                Weather.ExtremelyHarshSunlight,
-            ]
-        ):
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.Swarm if (
-            move.type == PokemonType.Bug
-            and attacker.current_hp
-            <= math.floor(attacker.stat(Stat.HP, game_state) / 3)
-        ):
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.Torrent if (
-            move.type == PokemonType.Water
-            and attacker.current_hp
-            <= math.floor(attacker.stat(Stat.HP, game_state) / 3)
-        ):
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.DragonsMaw if move.type == PokemonType.Dragon:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.RockyPayload if move.type == PokemonType.Rock:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.SteelySpirit if move.type == PokemonType.Steel:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-            # TODO Ally
-        case Ability.Steelworker if move.type == PokemonType.Steel:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.Transistor if move.type == PokemonType.Electric:
-            chain.append(_EffectiveAttackMults.FIFTY_OFFENCE)
-        case Ability.WaterBubble if move.type == PokemonType.Water:
-            chain.append(_EffectiveAttackMults.DOUBLE_OFFENCE)
+    if attacker_hooks.attack is not None:
+        _append(chain, attacker_hooks.attack(attacker, move, game_state))
 
     # Defender abilities
     if not move.ignores_ability:
-        match target.ability:
-            case Ability.PurifyingSalt if move.type == PokemonType.Ghost:
-                chain.append(_EffectiveAttackMults.HALF_DEFENCE)
-            case Ability.PurifyingSalt if move.type in [
-                PokemonType.Fire,
-                PokemonType.Ice,
-            ]:
-                chain.append(_EffectiveAttackMults.HALF_DEFENCE)
+        target_attack = ability_hooks(target.ability).target_attack
+        if target_attack is not None:
+            _append(chain, target_attack(move))
 
     # TODO items
 
@@ -497,43 +692,73 @@ class _EffectiveDefenceMults:
     DOUBLE_ITEM = _ChainMultiplier(8192, 4)
 
 
-def calc_effective_defence(
-    attacker: "Pokemon",
-    target: "Pokemon",
-    move: "_MoveDetails",
-    game_state: "GameState",
-) -> int:
-    match move.base_move.category:
+# TODO Flower Gift
+
+
+@_hook("defence", Ability.FurCoat)
+def _fur_coat(
+    target: "Pokemon", attacker: "Pokemon", stat: Stat, game_state: "GameState"
+):
+    if stat == Stat.Defence:
+        return _EffectiveDefenceMults.FUR_COAT
+
+
+@_hook("defence", Ability.GrassPelt)
+def _grass_pelt(
+    target: "Pokemon", attacker: "Pokemon", stat: Stat, game_state: "GameState"
+):
+    if game_state.terrain == Terrain.Grassy and stat == Stat.Defence:
+        return _EffectiveDefenceMults.ONE_FIVE_ABILITIES
+
+
+@_hook("defence", Ability.MarvelScale)
+def _marvel_scale(
+    target: "Pokemon", attacker: "Pokemon", stat: Stat, game_state: "GameState"
+):
+    if attacker.status is not None:
+        return _EffectiveDefenceMults.ONE_FIVE_ABILITIES
+
+
+def calc_defence_stat(move: Move) -> Stat:
+    match move.category:
         case MoveCategory.Physical:
             defense_stat = Stat.Defence
         case MoveCategory.Special:
             defense_stat = Stat.SpecialDefence
         case MoveCategory.Status:
             raise ValueError("This move doesn't have an effective attack")
-    defence_stat = move.base_move.overrideDefensiveStat or defense_stat
-    defence: int = target.stat(defence_stat, game_state)
+    return move.overrideDefensiveStat or defense_stat
 
+
+def calc_weather_defence_boost(target: "Pokemon", game_state: "GameState") -> bool:
     match game_state.weather:
         case Weather.Sandstorm if PokemonType.Rock in target.get_types():
-            defence = pokemon_round(defence * 6144 / 4096)
+            return True
         case Weather.Snow if PokemonType.Ice in target.get_types():
-            defence = pokemon_round(defence * 6144 / 4096)
+            return True
+    return False
+
+
+def calc_effective_defence(
+    attacker: "Pokemon",
+    target: "Pokemon",
+    move: "_MoveDetails",
+    game_state: "GameState",
+) -> int:
+    defence_stat = calc_defence_stat(move.base_move)
+    defence: int = target.stat(defence_stat, game_state)
+
+    if calc_weather_defence_boost(target, game_state):
+        defence = apply_modifier(defence, 6144)
 
     # TODO boosts (unaware, chip away, sacred sword)
 
     chain: list[_ChainMultiplier] = []
 
     # Defence abilities
-    match target.ability:
-        # TODO Flower Gift
-        case Ability.FurCoat if defence_stat == Stat.Defence:
-            chain.append(_EffectiveDefenceMults.FUR_COAT)
-        case Ability.GrassPelt if (
-            game_state.terrain == Terrain.Grassy and defence_stat == Stat.Defence
-        ):
-            chain.append(_EffectiveDefenceMults.ONE_FIVE_ABILITIES)
-        case Ability.MarvelScale if attacker.status is not None:
-            chain.append(_EffectiveDefenceMults.ONE_FIVE_ABILITIES)
+    defence_hook = ability_hooks(target.ability).defence
+    if defence_hook is not None:
+        _append(chain, defence_hook(target, attacker, defence_stat, game_state))
     # TODO items
 
     return defence
@@ -547,37 +772,12 @@ def calc_type_effectiveness(
 ) -> float:
     # TODO Iron Ball
     # TODO Ring Target
-    if (
-        move.base_move.name == "Thousand Arrows"
-        and PokemonType.Flying in target.get_types()
-    ):
-        return TypeMatchup.Neutral
-
-    type_effectiveness = TypeMatchup.Neutral
-    for poke_type in target.species.types:
-        multiplier = TYPE_CHART[poke_type].get(move.type, TypeMatchup.Neutral)
-        if (
-            poke_type == PokemonType.Flying
-            and game_state.weather == Weather.StrongWinds
-            and multiplier == TypeMatchup.SuperEffective
-        ):
-            continue
-        if (
-            move.type in [PokemonType.Fighting, PokemonType.Normal]
-            and poke_type == PokemonType.Ghost
-        ):
-            continue
-        if move.base_move.name == "Freeze-Dry" and poke_type == PokemonType.Water:
-            type_effectiveness *= TypeMatchup.SuperEffective
-            continue
-        type_effectiveness *= multiplier
-
-    if move.base_move.name == "Flying Press":
-        type_effectiveness *= TYPE_CHART[PokemonType.Flying].get(
-            move.type, TypeMatchup.Neutral
-        )
-
-    return type_effectiveness
+    return type_chart.lookup(
+        move.type,
+        target.species.types,
+        move.base_move.features & MoveFeature.SPECIAL_EFFECTIVENESS,
+        game_state.weather == Weather.StrongWinds,
+    )
 
 
 def calc_other_multipliers(
@@ -613,6 +813,53 @@ def calc_other_multipliers(
     return 1.0
 
 
+_FLAG_IMMUNITIES = {
+    Ability.WindRider: MoveFlag.Wind,
+    Ability.Bulletproof: MoveFlag.Bullet,
+    Ability.Soundproof: MoveFlag.Sound,
+}
+_TYPE_IMMUNITIES = {
+    Ability.EarthEater: PokemonType.Ground,
+    Ability.FlashFire: PokemonType.Fire,
+    Ability.DrySkin: PokemonType.Water,
+    Ability.Levitate: PokemonType.Ground,
+    Ability.LightningRod: PokemonType.Electric,
+    Ability.MotorDrive: PokemonType.Electric,
+    Ability.SapSipper: PokemonType.Grass,
+    Ability.StormDrain: PokemonType.Water,
+    Ability.VoltAbsorb: PokemonType.Electric,
+    Ability.WaterAbsorb: PokemonType.Water,
+    Ability.WellBakedBody: PokemonType.Fire,
+}
+
+
+def _flag_immunity(flag: MoveFlag) -> _ImmunityHook:
+    def immunity(move: "_MoveDetails", type_effectiveness: float) -> bool:
+        return move.base_move.has_flag(flag)
+
+    return immunity
+
+
+def _type_immunity(type_: PokemonType) -> _ImmunityHook:
+    def immunity(move: "_MoveDetails", type_effectiveness: float) -> bool:
+        return move.type == type_
+
+    return immunity
+
+
+for _ability, _flag in _FLAG_IMMUNITIES.items():
+    _hook("immunity", _ability)(_flag_immunity(_flag))
+for _ability, _type in _TYPE_IMMUNITIES.items():
+    _hook("immunity", _ability)(_type_immunity(_type))
+
+# TODO Disguise
+
+
+@_hook("immunity", Ability.WonderGuard)
+def _wonder_guard(move: "_MoveDetails", type_effectiveness: float) -> bool:
+    return not type_effectiveness > 1.0
+
+
 def calc_immunities(
     attacker: "Pokemon",
     target: "Pokemon",
@@ -621,69 +868,119 @@ def calc_immunities(
     type_effectiveness: float,
 ) -> bool:
     if not move.ignores_ability:
-        flag_immunities = [
-            (Ability.WindRider, MoveFlag.Wind),
-            (Ability.Bulletproof, MoveFlag.Bullet),
-            (Ability.Soundproof, MoveFlag.Sound),
-        ]
-        for ability, flag in flag_immunities:
-            if move.base_move.has_flag(flag) and target.has_ability(ability):
-                return True
-        type_immunities = [
-            (Ability.EarthEater, PokemonType.Ground),
-            (Ability.FlashFire, PokemonType.Fire),
-            (Ability.DrySkin, PokemonType.Water),
-            (Ability.Levitate, PokemonType.Ground),
-            (Ability.LightningRod, PokemonType.Electric),
-            (Ability.MotorDrive, PokemonType.Electric),
-            (Ability.SapSipper, PokemonType.Grass),
-            (Ability.StormDrain, PokemonType.Water),
-            (Ability.VoltAbsorb, PokemonType.Electric),
-            (Ability.WaterAbsorb, PokemonType.Water),
-            (Ability.WellBakedBody, PokemonType.Fire),
-        ]
-        for ability, type_ in type_immunities:
-            if move.type == type_ and target.has_ability(ability):
-                return True
-
-        # TODO Disguise
-
-        if target.has_ability(Ability.WonderGuard) and not type_effectiveness > 1.0:
+        immunity = ability_hooks(target.ability).immunity
+        if immunity is not None and immunity(move, type_effectiveness):
             return True
     return False
 
 
+def calc_accuracy(
+    attacker: "Pokemon",
+    target: "Pokemon",
+    move: "_MoveDetails",
+    game_state: "GameState",
+) -> float:
+    """The chance that the move hits, or each hit of a multiaccuracy move."""
+    if move.base_move.accuracy is True:
+        return 1.0
+    if attacker.has_ability(Ability.NoGuard) or target.has_ability(Ability.NoGuard):
+        return 1.0
+
+    accuracy = move.base_move.accuracy
+    features = move.base_move.features
+    match game_state.weather:
+        case Weather.Hail | Weather.Snow if features & MoveFeature.SNOW_ACCURACY:
+            return 1.0
+        case Weather.RainDance | Weather.HeavyRain if (
+            features & MoveFeature.RAIN_ACCURACY
+        ):
+            return 1.0
+        case Weather.SunnyDay | Weather.ExtremelyHarshSunlight if (
+            features & MoveFeature.RAIN_ACCURACY
+        ):
+            accuracy = 50
+
+    stage = 0
+    if move.ignores_ability or not target.has_ability(Ability.Unaware):
+        stage += attacker.boosts.accuracy
+    if not (
+        move.base_move.ignoreEvasion
+        or attacker.ability in [Ability.Unaware, Ability.KeenEye, Ability.MindsEye]
+    ):
+        stage -= target.boosts.evasion
+    stage = min(max(stage, -6), 6)
+    if stage > 0:
+        accuracy = accuracy * (3 + stage) // 3
+    elif stage < 0:
+        accuracy = accuracy * 3 // (3 - stage)
+
+    # TODO items
+    if attacker.has_ability(Ability.CompoundEyes):
+        accuracy = apply_modifier(accuracy, 5325)
+    if attacker.has_ability(Ability.VictoryStar):
+        accuracy = apply_modifier(accuracy, 4506)
+    if (
+        attacker.has_ability(Ability.Hustle)
+        and move.base_move.category == MoveCategory.Physical
+    ):
+        accuracy = apply_modifier(accuracy, 3277)
+    if not move.ignores_ability:
+        match target.ability:
+            case Ability.SandVeil if game_state.weather == Weather.Sandstorm:
+                accuracy = apply_modifier(accuracy, 3277)
+            case Ability.SnowCloak if game_state.weather in [Weather.Hail, Weather.Snow]:
+                accuracy = apply_modifier(accuracy, 3277)
+    return min(accuracy, 100) / 100
+
+
+@_hook("stat", Ability.Chlorophyll)
+def _chlorophyll(pokemon: "Pokemon", game_state: "GameState", stat: Stat) -> float:
+    return 2 if stat == Stat.Speed and game_state.weather == Weather.SunnyDay else 1
+
+
+# TODO Flower Gift
+# TODO minus
+# TODO plus
+
+
+@_hook("stat", Ability.SurgeSurfer)
+def _surge_surfer(pokemon: "Pokemon", game_state: "GameState", stat: Stat) -> float:
+    return 2 if stat == Stat.Speed and game_state.terrain == Terrain.Electric else 1
+
+
+# TODO protosynthesis
+# TODO quark drive
+
+
+@_hook("stat", Ability.QuickFeet)
+def _quick_feet(pokemon: "Pokemon", game_state: "GameState", stat: Stat) -> float:
+    return 1.5 if pokemon.status is not None else 1
+
+
+_WEATHER_SPEED_ABILITIES = {
+    Ability.SandRush: [Weather.Sandstorm],
+    Ability.SlushRush: [Weather.Hail, Weather.Snow],
+    Ability.SwiftSwim: [Weather.RainDance, Weather.HeavyRain],
+}
+
+
+@_hook("stat", *_WEATHER_SPEED_ABILITIES)
+def _weather_speed(pokemon: "Pokemon", game_state: "GameState", stat: Stat) -> float:
+    return 2.0 if game_state.weather in _WEATHER_SPEED_ABILITIES[pokemon.ability] else 1
+
+
+@_hook("stat", Ability.Unburden)
+def _unburden(pokemon: "Pokemon", game_state: "GameState", stat: Stat) -> float:
+    return 2.0 if pokemon.item is None else 1
+
+
 def stat_modifications(
     pokemon: "Pokemon", game_state: "GameState", stat: Stat, result: int
 ) -> int:
     multiplier = 1
-    match pokemon.ability:
-        case Ability.Chlorophyll if (
-            stat == Stat.Speed and game_state.weather == Weather.SunnyDay
-        ):
-            multiplier *= 2
-        # TODO Flower Gift
-        # TODO minus
-        # TODO plus
-        case Ability.SurgeSurfer if (
-            stat == Stat.Speed and game_state.terrain == Terrain.Electric
-        ):
-            multiplier *= 2
-        # TODO protosynthesis
-        # TODO quark drive
-        case Ability.QuickFeet if pokemon.status is not None:
-            multiplier *= 1.5
-        case Ability.SandRush if game_state.weather == Weather.Sandstorm:
-            multiplier *= 2.0
-        case Ability.SlushRush if game_state.weather in [Weather.Hail, Weather.Snow]:
-            multiplier *= 2.0
-        case Ability.SwiftSwim if game_state.weather in [
-            Weather.RainDance,
-            Weather.HeavyRain,
-        ]:
-            multiplier *= 2.0
-        case Ability.Unburden if pokemon.item is None:
-            multiplier *= 2.0
+    stat_hook = ability_hooks(pokemon.ability).stat
+    if stat_hook is not None:
+        multiplier *= stat_hook(pokemon, game_state, stat)
     if pokemon.status == Status.Paralysis and stat == Stat.Speed:
         multiplier *= 0.5
     if multiplier != 1:
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import MISSING, dataclass, fields
+from operator import attrgetter
+from typing import Iterable, Optional
 
 from serde import field, serde
 
@@ -29,7 +30,13 @@ from pokemon_damage_calculator.model.enums import (
 )
 
 
+_STAT_SLOTS = ("hp", "atk", "def_", "spa", "spd", "spe")
+"""Attribute names of StatDistribution, indexed by Stat.ordinal"""
+_STAT_GETTERS = tuple(attrgetter(slot) for slot in _STAT_SLOTS)
+
+
 @serde
+@dataclass(slots=True)
 class StatDistribution:
     hp: int = 0
     atk: int = 0
@@ -39,16 +46,10 @@ class StatDistribution:
     spe: int = 0
 
     def __getitem__(self, index: Stat) -> int:
-        if index == Stat.Defence:
-            return self.def_
-        else:
-            return getattr(self, index.value)
+        return _STAT_GETTERS[index.ordinal](self)
 
     def __setitem__(self, index: Stat, value: int):
-        if index == Stat.Defence:
-            self.def_ = value
-        else:
-            setattr(self, index.value, value)
+        setattr(self, _STAT_SLOTS[index.ordinal], value)
 
     @staticmethod
     def flat(n=0) -> "StatDistribution":
@@ -59,6 +60,14 @@ class StatDistribution:
         return StatDistribution(hp=hp, atk=atk, def_=def_, spa=spa, spd=spd, spe=spe)
 
 
+@dataclass(slots=True)
+class Boosts(StatDistribution):
+    """Stat stages, and the accuracy and evasion stages that have no stat."""
+
+    accuracy: int = 0
+    evasion: int = 0
+
+
 @serde
 class Species:
     name: str
@@ -72,9 +81,102 @@ class Species:
         return f"<{self.name}>"
 
 
-@dataclass(kw_only=True)  # shuts up pylance, TODO fix this
+class MoveFeature:
+    """
+    Bits of `Move.features`, the behaviours the calc checks moves for. The
+    move's flags are the bits from FLAG_SHIFT up, see `flag_mask`.
+    """
+
+    SURE_CRIT = 1 << 0
+    FACADE = 1 << 1
+    BRINE = 1 << 2
+    SOLAR = 1 << 3
+    """Halved in weather other than sun"""
+    VENOSHOCK = 1 << 4
+    FREEZE_DRY = 1 << 5
+    FLYING_PRESS = 1 << 6
+    THOUSAND_ARROWS = 1 << 7
+    GROUND_SHAKING = 1 << 8
+    """Halved against grounded targets on Grassy Terrain"""
+    NORMAL = 1 << 9
+    """`Move.is_normal`"""
+    SPREAD = 1 << 10
+    """Hits more than one target in doubles"""
+    SNOW_ACCURACY = 1 << 11
+    """Sure to hit in hail or snow"""
+    RAIN_ACCURACY = 1 << 12
+    """Sure to hit in rain, 50% accurate in sun"""
+
+    SPECIAL_EFFECTIVENESS = FREEZE_DRY | FLYING_PRESS | THOUSAND_ARROWS
+    """Type effectiveness depends on more than the move's type"""
+
+    FLAG_SHIFT = 16
+
+
+def flag_mask(flag: MoveFlag) -> int:
+    """The bit of `Move.features` that is set when the move has `flag`."""
+    return flag.bit << MoveFeature.FLAG_SHIFT
+
+
+def flag_bits(flags: Iterable[MoveFlag]) -> int:
+    """`Move.flags` of a move with `flags`."""
+    result = 0
+    for flag in flags:
+        result |= flag.bit
+    return result
+
+
+def flag_list(bits: int) -> list[MoveFlag]:
+    return [flag for flag in MoveFlag if bits & flag.bit]
+
+
+def _parse_flags(flags: Iterable[str]) -> int:
+    # moves.json has the flags as a dict of name to 1
+    return flag_bits(MoveFlag(flag) for flag in flags)
+
+
+def _serialize_flags(bits: int) -> dict[str, int]:
+    return {flag.value: 1 for flag in flag_list(bits)}
+
+
+_NOT_NORMAL_FLAGS = flag_bits([MoveFlag.Recharge, MoveFlag.Charge, MoveFlag.FutureMove])
+
+_NAMED_FEATURES = {
+    "Storm Throw": MoveFeature.SURE_CRIT,
+    "Frost Breath": MoveFeature.SURE_CRIT,
+    "Facade": MoveFeature.FACADE,
+    "Brine": MoveFeature.BRINE,
+    "Solar Beam": MoveFeature.SOLAR,
+    "Solar Blade": MoveFeature.SOLAR,
+    "Venoshock": MoveFeature.VENOSHOCK,
+    "Freeze-Dry": MoveFeature.FREEZE_DRY,
+    "Flying Press": MoveFeature.FLYING_PRESS,
+    "Thousand Arrows": MoveFeature.THOUSAND_ARROWS,
+    "Earthquake": MoveFeature.GROUND_SHAKING,
+    "Bulldoze": MoveFeature.GROUND_SHAKING,
+    "Magnitude": MoveFeature.GROUND_SHAKING,
+    "Blizzard": MoveFeature.SNOW_ACCURACY,
+    "Thunder": MoveFeature.RAIN_ACCURACY,
+    "Hurricane": MoveFeature.RAIN_ACCURACY,
+}
+
+_SINGLE_TARGETS = frozenset(
+    {
+        Target.Self,
+        Target.AdjacentAlly,
+        Target.AdjacentAllyOrSelf,
+        Target.AdjacentFoe,
+        Target.Any,
+        Target.Normal,
+        Target.RandomNormal,
+        Target.AllyTeam,
+        Target.Scripted,
+    }
+)
+
+
 @serde
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Move:
     num: int
     accuracy: int | bool
@@ -84,7 +186,8 @@ class Move:
     name: str
     pp: int
     priority: int
-    flags: list[MoveFlag]  # enum not comprehensive
+    flags: int = field(deserializer=_parse_flags, serializer=_serialize_flags)
+    """MoveFlag bits"""  # enum not comprehensive
     isZ: Optional[str]
     critRatio: Optional[int]
     secondary: dict | None
@@ -142,29 +245,49 @@ class Move:
     tracksTarget: bool = field(default=False)
     stealsBoosts: bool = field(default=False)
     struggleRecoil: bool = field(default=False)
+    features: int = field(default=0, skip=True)
+    """`MoveFeature` bits, worked out when the move is loaded"""
 
     def __init__(self, **kwargs) -> None:
-        self.__dict__ = kwargs
+        # Fields missing from the data are None unless they have a default
+        for name, default in _MOVE_DEFAULTS:
+            setattr(self, name, kwargs.get(name, default))
+        self.features = self._features()
+
+    def _features(self) -> int:
+        features = _NAMED_FEATURES.get(self.name, 0)
+        if self.willCrit:
+            features |= MoveFeature.SURE_CRIT
+        if self._is_normal():
+            features |= MoveFeature.NORMAL
+        if self.target not in _SINGLE_TARGETS:
+            features |= MoveFeature.SPREAD
+        return features | self.flags << MoveFeature.FLAG_SHIFT
 
     @classmethod
     def load_json(cls, data) -> "Move":
-        data["flags"] = data["flags"].keys()
+        data["flags"] = _parse_flags(data["flags"])
         result = Move(**data)
         return result
 
     def has_flag(self, flag: MoveFlag) -> bool:
-        return flag in self.flags
+        return bool(self.flags & flag.bit)
+
+    def has_feature(self, feature: int) -> bool:
+        return bool(self.features & feature)
 
     def is_normal(self) -> bool:
+        return bool(self.features & MoveFeature.NORMAL)
+
+    def _is_normal(self) -> bool:
         if self.selfdestruct:
             return False
         if self.name in ["Dream Eater", "Belch"]:
             return False
         if self.condition and "duration" in self.condition:
             return False
-        for flag in [MoveFlag.Recharge, MoveFlag.Charge, MoveFlag.FutureMove]:
-            if flag in self.flags:
-                return False
+        if self.flags & _NOT_NORMAL_FLAGS:
+            return False
         if isinstance(self.accuracy, int):
             if self.accuracy <= 50:
                 return False
@@ -178,12 +301,21 @@ class Move:
             category=category,
             type=PokemonType.Unknown,
             accuracy=100,
+            flags=0,
+            target=Target.Normal,
         )
 
     def __repr__(self) -> str:
         return f"<{self.name}>"
 
 
+_MOVE_DEFAULTS = tuple(
+    (f.name, None if f.default is MISSING else f.default)
+    for f in fields(Move)
+    if f.name != "features"
+)
+
+
 @serde(deny_unknown_fields=True)
 class NatureModel:
     name: str
@@ -0,0 +1,108 @@
+"""
+Type effectiveness as flat tables, one lookup per calc.
+
+A table holds the effectiveness of every attacking type against every
+combination of one or two defending types, built from `utils.TYPE_CHART` by
+`type_effectiveness`, so it agrees with it by construction. There is a table
+for each variant the calc needs: Strong Winds and the moves in
+`MoveFeature.SPECIAL_EFFECTIVENESS`. Tables are built the first time they are
+used; call `effectiveness_table.cache_clear()` after editing TYPE_CHART.
+"""
+
+from functools import cache
+from typing import Sequence
+
+from pokemon_damage_calculator.model.enums import PokemonType, TypeMatchup
+from pokemon_damage_calculator.model.models import MoveFeature
+from pokemon_damage_calculator.utils import TYPE_CHART
+
+TYPES = list(PokemonType)
+TYPE_INDEX = {type_: i for i, type_ in enumerate(TYPES)}
+NO_TYPE = len(TYPES)
+"""The second type index of a single-typed defender"""
+PAIRS = (len(TYPES) + 1) ** 2
+"""Number of defender type combinations a table has a column for"""
+
+
+def pair_index(types: Sequence[PokemonType]) -> int:
+    """The column of a defender with one or two `types`."""
+    second = TYPE_INDEX[types[1]] if len(types) > 1 else NO_TYPE
+    return TYPE_INDEX[types[0]] * (NO_TYPE + 1) + second
+
+
+def type_effectiveness(
+    move_type: PokemonType,
+    defender_types: Sequence[PokemonType],
+    special: int = 0,
+    strong_winds: bool = False,
+) -> float:
+    """
+    Effectiveness of a move of `move_type`. `special` are its
+    `MoveFeature.SPECIAL_EFFECTIVENESS` bits.
+    """
+    if special & MoveFeature.THOUSAND_ARROWS and PokemonType.Flying in defender_types:
+        return TypeMatchup.Neutral
+
+    type_effectiveness = TypeMatchup.Neutral
+    for poke_type in defender_types:
+        multiplier = TYPE_CHART[poke_type].get(move_type, TypeMatchup.Neutral)
+        if (
+            poke_type == PokemonType.Flying
+            and strong_winds
+            and multiplier == TypeMatchup.SuperEffective
+        ):
+            continue
+        if (
+            move_type in [PokemonType.Fighting, PokemonType.Normal]
+            and poke_type == PokemonType.Ghost
+        ):
+            continue
+        if special & MoveFeature.FREEZE_DRY and poke_type == PokemonType.Water:
+            type_effectiveness *= TypeMatchup.SuperEffective
+            continue
+        type_effectiveness *= multiplier
+
+    if special & MoveFeature.FLYING_PRESS:
+        type_effectiveness *= TYPE_CHART[PokemonType.Flying].get(
+            move_type, TypeMatchup.Neutral
+        )
+
+    return type_effectiveness
+
+
+@cache
+def effectiveness_table(special: int = 0, strong_winds: bool = False) -> list[float]:
+    """
+    `type_effectiveness` for every move type and defender, indexed by
+    `TYPE_INDEX[move_type] * PAIRS + pair_index(defender_types)`. Columns of
+    combinations no defender can have, such as no first type, are 1.
+    """
+    table = [1.0] * (len(TYPES) * PAIRS)
+    for move_type in TYPES:
+        row = TYPE_INDEX[move_type] * PAIRS
+        for first in TYPES:
+            types = [first]
+            table[row + pair_index(types)] = float(
+                type_effectiveness(move_type, types, special, strong_winds)
+            )
+            for second in TYPES:
+                types = [first, second]
+                table[row + pair_index(types)] = float(
+                    type_effectiveness(move_type, types, special, strong_winds)
+                )
+    return table
+
+
+def lookup(
+    move_type: PokemonType,
+    defender_types: Sequence[PokemonType],
+    special: int = 0,
+    strong_winds: bool = False,
+) -> float:
+    """`type_effectiveness` from the tables."""
+    if len(defender_types) > 2:
+        return float(
+            type_effectiveness(move_type, defender_types, special, strong_winds)
+        )
+    table = effectiveness_table(special, strong_winds)
+    return table[TYPE_INDEX[move_type] * PAIRS + pair_index(defender_types)]
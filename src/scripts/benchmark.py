@@ -0,0 +1,282 @@
+"""
+Cold-start and hot-path benchmarks. Cold-start measurements run in fresh
+interpreters, hot-path ones in this process after warming up; both report the
+median. Run from the repository root, as the data paths are relative.
+
+    python src/scripts/benchmark.py                      # print results
+    python src/scripts/benchmark.py --save base.json     # also record a baseline
+    python src/scripts/benchmark.py --compare base.json  # diff against a baseline
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Any, Callable
+
+MODULES = [
+    "pokemon_damage_calculator.model.models",
+    "pokemon_damage_calculator.model.logic",
+    "pokemon_damage_calculator.data",
+    "pokemon_damage_calculator.calc.pokemon",
+    "pokemon_damage_calculator.calc.damage_calc",
+    "pokemon_damage_calculator.calc.calcbuilder",
+]
+
+_IMPORT = """
+import importlib, json, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(json.dumps(time.perf_counter() - start))
+"""
+
+_IMPORT_AND_LOAD = """
+import json, time
+start = time.perf_counter()
+import pokemon_damage_calculator.data as data
+data._pokedex, data._moves, data._natures, data._learnsets
+print(json.dumps(time.perf_counter() - start))
+"""
+
+_DATA_LOAD = """
+import json, time
+import pokemon_damage_calculator.data as data
+result = {}
+for source, parse in data._SOURCES.items():
+    start = time.perf_counter()
+    parse(source)
+    result[source] = time.perf_counter() - start
+print(json.dumps(result))
+"""
+
+_PEAK_RSS = """
+import json, resource
+import pokemon_damage_calculator.data as data
+data._pokedex, data._moves, data._natures, data._learnsets
+# ru_maxrss is in KiB on Linux
+print(json.dumps(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+"""
+
+_FIRST_CALC = """
+import json, time
+start = time.perf_counter()
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+imported = time.perf_counter()
+Format.gen9vgc().game(PokemonBuilder("rillaboom"), PokemonBuilder("flareon")).calc(
+    "stompingtantrum"
+)
+end = time.perf_counter()
+print(json.dumps({"import + first calc": end - start, "first calc": end - imported}))
+"""
+
+
+def _run_fresh(snippet: str, repeat: int) -> Any:
+    """Median of the JSON value(s) printed by `snippet` over `repeat` new processes."""
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", snippet], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output))
+    if isinstance(samples[0], dict):
+        return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+    return statistics.median(samples)
+
+
+def import_saving(repeat: int = 5) -> tuple[float, float]:
+    """
+    Import time of the data module against import plus loading every table,
+    which is what importing it used to cost.
+    """
+    return (
+        _run_fresh(_IMPORT.format(module="pokemon_damage_calculator.data"), repeat),
+        _run_fresh(_IMPORT_AND_LOAD, repeat),
+    )
+
+
+def run_all(repeat: int = 5) -> dict[str, dict[str, float]]:
+    lazy, eager = import_saving(repeat)
+    return {
+        "import (ms)": {
+            module: 1000 * _run_fresh(_IMPORT.format(module=module), repeat)
+            for module in MODULES
+        },
+        "data load (ms)": {
+            "import pokemon_damage_calculator.data": 1000 * lazy,
+            "import + load all tables": 1000 * eager,
+            **{
+                f"parse {source}": 1000 * seconds
+                for source, seconds in _run_fresh(_DATA_LOAD, repeat).items()
+            },
+        },
+        "memory (MiB)": {
+            "peak RSS after loading all tables": _run_fresh(_PEAK_RSS, repeat)
+        },
+        "first calc (ms)": {
+            name: 1000 * seconds
+            for name, seconds in _run_fresh(_FIRST_CALC, repeat).items()
+        },
+    }
+
+
+def _median_ms(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Median milliseconds for `number` calls of `func`."""
+    func()
+    return 1000 * statistics.median(timeit.repeat(func, number=number, repeat=repeat))
+
+
+def _rank_moves_pairs():
+    """The attacker/defender pairs scripts/rank_moves.py compares by default."""
+    from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+    from pokemon_damage_calculator.model.models import StatDistribution
+    from pokemon_damage_calculator.model.natures import Nature
+
+    malamar = (
+        PokemonBuilder("malamar")
+        .evs(StatDistribution(spa=252, def_=252))
+        .nature(Nature.ADAMANT)
+        .build()
+    )
+    for species in ["ironvaliant", "incineroar"]:
+        for evs in [StatDistribution.flat(100), StatDistribution.flat(252)]:
+            other = PokemonBuilder(species).evs(evs).build()
+            yield malamar, other
+            yield other, malamar
+
+
+def rank_moves_workload() -> None:
+    from pokemon_damage_calculator.calc.calcbuilder import Format
+    from pokemon_damage_calculator.data import get_learnset
+
+    for attacker, defender in _rank_moves_pairs():
+        game = Format.gen9vgc().game(attacker, defender)
+        for move in get_learnset(attacker.species):
+            if move.is_normal():
+                game.calc(move)
+
+
+def rank_moves_batched_workload(numpy_rolls: bool = False) -> None:
+    """rank_moves_workload through GameState.calc_many."""
+    from pokemon_damage_calculator.calc.calcbuilder import Format
+    from pokemon_damage_calculator.data import get_learnset
+
+    for attacker, defender in _rank_moves_pairs():
+        game = Format.gen9vgc().numpy_rolls(numpy_rolls).game(attacker, defender)
+        game.calc_many(
+            move for move in get_learnset(attacker.species) if move.is_normal()
+        )
+
+
+def _threat_list():
+    from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+    from pokemon_damage_calculator.data import _species_list
+
+    attacker = PokemonBuilder("garchomp").build()
+    return attacker, [PokemonBuilder(species).build() for species in _species_list()]
+
+
+def threat_list_workload() -> None:
+    """Earthquake against the whole dex, one game per defender."""
+    from pokemon_damage_calculator.calc.calcbuilder import Format
+
+    attacker, defenders = _threat_list()
+    for defender in defenders:
+        Format.gen9vgc().game(attacker.copy(), defender.copy()).calc("earthquake")
+
+
+def threat_list_plan_workload() -> None:
+    """threat_list_workload with one CalcPlan and field, ignoring entry effects."""
+    from pokemon_damage_calculator.calc.calcbuilder import Format
+
+    attacker, defenders = _threat_list()
+    format = Format.gen9vgc()
+    plan = format.plan(attacker, "earthquake")
+    game = format.game(attacker.copy(), defenders[0].copy())
+    for defender in defenders:
+        plan.run(defender, game)
+
+
+def threat_list_vectorized_workload() -> None:
+    """threat_list_workload through calc.vectorized, including building the table."""
+    from pokemon_damage_calculator.calc.calcbuilder import Format
+    from pokemon_damage_calculator.calc.vectorized import damage_against
+
+    attacker, defenders = _threat_list()
+    damage_against(Format.gen9vgc(), attacker, defenders, "earthquake")
+
+
+def stat_workload() -> None:
+    """The stat lookups of one rank_moves_workload's worth of calcs."""
+    from pokemon_damage_calculator.model.enums import Stat
+
+    for attacker, defender in _rank_moves_pairs():
+        for _ in range(100):
+            for pokemon in (attacker, defender):
+                for stat in Stat:
+                    pokemon.raw_stat(stat)
+                    pokemon.boost_fraction(stat)
+
+
+def hot_path(repeat: int = 5) -> dict[str, dict[str, float]]:
+    # Unhandled base power callbacks log an error per calc
+    logging.disable(logging.ERROR)
+    return {
+        "hot path (ms)": {
+            "raw_stat + boost_fraction, rank_moves pairs": _median_ms(
+                stat_workload, 1, repeat
+            ),
+            "rank_moves workload": _median_ms(rank_moves_workload, 1, repeat),
+            "rank_moves workload, calc_many": _median_ms(
+                rank_moves_batched_workload, 1, repeat
+            ),
+            "rank_moves workload, calc_many with numpy rolls": _median_ms(
+                lambda: rank_moves_batched_workload(numpy_rolls=True), 1, repeat
+            ),
+            "earthquake vs whole dex": _median_ms(threat_list_workload, 1, repeat),
+            "earthquake vs whole dex, CalcPlan": _median_ms(
+                threat_list_plan_workload, 1, repeat
+            ),
+            "earthquake vs whole dex, vectorized": _median_ms(
+                threat_list_vectorized_workload, 1, repeat
+            ),
+        }
+    }
+
+
+def report(results: dict[str, dict[str, float]], baseline: dict | None = None) -> None:
+    for section, values in results.items():
+        print(f"{section}:")
+        for name, value in values.items():
+            line = f"  {name:<60} {value:10.1f}"
+            if baseline is not None and name in baseline.get(section, {}):
+                before = baseline[section][name]
+                change = (value - before) / before * 100 if before else 0.0
+                line += f"  (baseline {before:10.1f}, {change:+6.1f}%)"
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start and hot-path benchmarks.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write the results to this baseline file")
+    parser.add_argument("--compare", help="compare against this baseline file")
+    parser.add_argument("--only", choices=["cold", "hot"], help="run one group")
+    args = parser.parse_args()
+
+    results = {}
+    if args.only != "hot":
+        results |= run_all(args.repeat)
+    if args.only != "cold":
+        results |= hot_path(args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    report(results, baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
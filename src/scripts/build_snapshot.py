@@ -0,0 +1,5 @@
+from pokemon_damage_calculator.data import build_snapshots
+
+if __name__ == "__main__":
+    for path in build_snapshots():
+        print(f"Wrote {path}")
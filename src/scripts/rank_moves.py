@@ -4,6 +4,7 @@ from itertools import chain
 import logging
 from typing import Callable, Iterable, override
 from pokemon_damage_calculator.calc.calcbuilder import Format, IntoPokemon, into_pokemon
+from pokemon_damage_calculator.calc.damage_result import DamageResult
 from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
 from pokemon_damage_calculator.data import (
     IntoSpecies,
@@ -34,7 +35,7 @@ class UniversalNature(NatureModel):
 @total_ordering
 class MoveRating:
     move: Move
-    damage: list[int]
+    damage: DamageResult
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, MoveRating):
@@ -44,17 +45,17 @@ class MoveRating:
     def __lt__(self, value: object) -> bool:
         if not isinstance(value, MoveRating):
             return False
-        return self.damage < value.damage
+        return self.damage.sort_key < value.damage.sort_key
 
     def __repr__(self) -> str:
-        return f"{self.move}: {self.damage[0]}-{self.damage[-1]}"
+        return f"{self.move}: {self.damage.min}-{self.damage.max}"
 
 
 @dataclass
 @total_ordering
 class MoveRatingList:
     move: Move
-    damage: list[list[int]]
+    damage: list[DamageResult]
 
     def reverse_print(self) -> str:
         return str(MoveRatingList(self.move, list(reversed(self.damage))))
@@ -69,10 +70,10 @@ class MoveRatingList:
         if not isinstance(value, MoveRatingList):
             return False
         assert len(value.damage) == len(self.damage)
-        return self.damage[0][0] < value.damage[0][0]
+        return self.damage[0].min < value.damage[0].min
 
     def __repr__(self) -> str:
-        ranges = "-".join(str(d[-1]) for d in self.damage)
+        ranges = "-".join(str(d.max) for d in self.damage)
         return f"{self.move}: {ranges}"
 
 
@@ -85,8 +86,10 @@ def rate_moves(
     learnset = get_learnset(attacker.species)
     game = Format.gen9vgc().game(attacker, defender)
 
+    moves = [move for move in learnset if move_filter(move)]
     ratings = [
-        MoveRating(move, game.calc(move)) for move in learnset if move_filter(move)
+        MoveRating(move, damage)
+        for move, damage in zip(moves, game.calc_many_results(moves))
     ]
 
     return ratings
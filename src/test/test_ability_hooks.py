@@ -0,0 +1,41 @@
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.model.enums import Ability, Terrain, Weather
+from pokemon_damage_calculator.model.logic import (
+    ABILITY_HOOKS,
+    ENTRY_ABILITIES,
+    ability_hooks,
+)
+from test.testutils import flareon
+
+
+def test_ability_hooks_stages():
+    assert ability_hooks(Ability.Intimidate).on_enter is not None
+    assert ability_hooks(Ability.Intimidate).power is None
+    # Orichalcum Pulse sets the sun and is boosted by it
+    hooks = ability_hooks(Ability.OrichalcumPulse)
+    assert hooks.on_enter is not None and hooks.attack_modifier is not None
+    assert ability_hooks(Ability.NoAbility) == ability_hooks(Ability.Stench)
+
+    assert ENTRY_ABILITIES == {
+        ability for ability, hooks in ABILITY_HOOKS.items() if hooks.on_enter
+    }
+
+
+def test_ability_hooks_dispatch():
+    format = Format.gen9vgc()
+    game = format.game(
+        PokemonBuilder("torkoal").ability(Ability.Drought).build(), flareon()
+    )
+    assert game.weather == Weather.SunnyDay
+
+    game = format.game(
+        PokemonBuilder("tapukoko").ability(Ability.ElectricSurge).build(), flareon()
+    )
+    assert game.terrain == Terrain.Electric
+
+    attacker = PokemonBuilder("garchomp").build()
+    defender = PokemonBuilder("bronzong").ability(Ability.Levitate).build()
+    assert format.game(attacker, defender).calc("earthquake") == [0] * 16
+    attacker.ability = Ability.MoldBreaker
+    assert format.game(attacker, defender).calc("earthquake") != [0] * 16
@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pokemon_damage_calculator.calc.bulk import pokedex_stats, raw_stats
+from pokemon_damage_calculator.calc.pokemon import Pokemon
+from pokemon_damage_calculator.data import _species_list, get_nature
+from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.model.models import StatDistribution
+from pokemon_damage_calculator.model.natures import Nature
+
+
+def test_pokedex_stats_match_pokemon():
+    spreads = [
+        (StatDistribution.flat(), StatDistribution.flat(31), get_nature(Nature.HARDY)),
+        (
+            StatDistribution(hp=4, atk=252, spe=252),
+            StatDistribution.flat(31),
+            get_nature(Nature.ADAMANT),
+        ),
+        (
+            StatDistribution.flat(255),
+            StatDistribution.flat(0),
+            get_nature(Nature.BRAVE),
+        ),
+    ]
+    for level in [1, 50, 100]:
+        stats = pokedex_stats(spreads, level)
+        assert stats.shape == (len(spreads), len(_species_list()), len(Stat))
+        for i, (evs, ivs, nature) in enumerate(spreads):
+            for j, species in enumerate(_species_list()):
+                pokemon = Pokemon(species, evs=evs, ivs=ivs, nature=nature, level=level)
+                assert [pokemon.raw_stat(stat) for stat in Stat] == list(stats[i, j])
+
+
+def test_raw_stats_broadcasts():
+    # Every EV amount of a 100 base stat, neutral and boosting
+    stats = raw_stats(
+        [[0, 100, 0, 0, 0, 0]], [[4 * e] * 6 for e in range(64)], 31, 50, 1.1
+    )
+    assert stats.shape == (64, 6)
+    assert stats[0, 1] == 132
+    assert stats[-1, 1] == 167
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from pokemon_damage_calculator.calc.calcbuilder import Format
-from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.data import get_learnset
+from pokemon_damage_calculator.model.enums import Ability, Stat, Status, Weather
 from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
 from pokemon_damage_calculator.model.natures import Nature
 from test.testutils import flareon, standard_calc
@@ -81,3 +84,53 @@ def test_auto_crit():
         flareon(),
         "wickedblow",
     ) == [68, 69, 70, 71, 72, 72, 73, 74, 75, 76, 76, 77, 78, 79, 80, 81]
+
+
+def test_calc_many_matches_calc():
+    pairs = [
+        (PokemonBuilder("kangaskhanmega").ability(Ability.ParentalBond), flareon()),
+        (
+            PokemonBuilder("toxapex").ability(Ability.Merciless),
+            PokemonBuilder("garchomp"),
+        ),
+        (
+            PokemonBuilder("excadrill").ability(Ability.MoldBreaker),
+            PokemonBuilder("rotomwash"),
+        ),
+    ]
+    for attacker, defender in pairs:
+        game = Format.gen9vgc().game(attacker, defender)
+        game.defender.status = Status.Poison
+        moves = [
+            move for move in get_learnset(game.attacker.species) if move.is_normal()
+        ]
+        assert game.calc_many(moves) == [game.calc(move) for move in moves]
+
+
+def test_calc_plan_matches_calc():
+    attacker = PokemonBuilder("garchomp").ability(Ability.SandForce).build()
+    defenders = [
+        PokemonBuilder(species).build()
+        for species in ["flareon", "skarmory", "rotomwash", "tyranitar", "gengar"]
+    ]
+    format = Format.gen9vgc()
+    plan = format.plan(attacker, "earthquake")
+    for weather in [Weather.NONE, Weather.Sandstorm, Weather.SunnyDay]:
+        for defender in defenders:
+            game = format.game(attacker, defender)
+            game.weather = weather
+            assert plan.run(defender, game) == game.calc("earthquake")
+
+
+def test_calc_plan_across_threads():
+    attacker = PokemonBuilder("garchomp").build()
+    defenders = [
+        PokemonBuilder(species).build() for species in ["flareon", "skarmory"] * 50
+    ]
+    format = Format.gen9vgc()
+    plan = format.plan(attacker, "dragonclaw")
+    games = [format.game(attacker, defender) for defender in defenders]
+    expected = [game.calc("dragonclaw") for game in games]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda game: plan.run(game.defender, game), games))
+    assert results == expected
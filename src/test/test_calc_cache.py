@@ -0,0 +1,92 @@
+from pokemon_damage_calculator.calc.calc_cache import CalcCache
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.model.enums import Ability, Stat, Terrain
+from test.testutils import flareon
+
+
+def _game(format: Format):
+    return format.game(PokemonBuilder("rillaboom").build(), flareon())
+
+
+def test_cached_calcs_match_uncached():
+    moves = ["woodhammer", "stompingtantrum", "swordsdance"]
+    expected = _game(Format.gen9vgc()).calc_many(moves)
+    format = Format.gen9vgc().calc_cache()
+
+    assert [_game(format).calc(move) for move in moves] == expected
+    assert _game(format).calc_many(moves) == expected
+    assert format.cache is not None
+    stats = format.cache.stats
+    assert (stats.hits, stats.misses, stats.evictions) == (3, 3, 0)
+
+
+def test_fingerprint_follows_inputs():
+    format = Format.gen9vgc().calc_cache()
+    game = _game(format)
+    first = game.calc("woodhammer")
+
+    game.attacker.boosts[Stat.Attack] = 2
+    game.attacker.invalidate_stats()
+    boosted = game.calc("woodhammer")
+    game.terrain = Terrain.Grassy
+    grassy = game.calc("woodhammer")
+
+    assert boosted != first and grassy != boosted
+    assert format.cache is not None
+    assert format.cache.stats.misses == 3
+    assert boosted == _game(Format.gen9vgc()).switch_attacker(game.attacker).calc(
+        "woodhammer"
+    )
+
+
+def test_returned_rolls_are_copies():
+    format = Format.gen9vgc().calc_cache()
+    rolls = _game(format).calc("woodhammer")
+    rolls.clear()
+
+    assert _game(format).calc("woodhammer") == _game(Format.gen9vgc()).calc(
+        "woodhammer"
+    )
+
+
+def test_evicts_least_recently_used():
+    cache = CalcCache(max_entries=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == [1]
+    cache.put("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1] and cache.get("c") == [3]
+    assert cache.stats.evictions == 1 and len(cache) == 2
+
+
+def test_byte_limit():
+    cache = CalcCache(max_entries=None, max_bytes=1000)
+    for i in range(100):
+        cache.put(i, list(range(16)))
+
+    assert 0 < len(cache) < 100
+    assert cache.nbytes <= 1000
+    assert cache.stats.evictions == 100 - len(cache)
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0 and cache.stats.evictions == 0
+
+
+def test_cache_off():
+    format = Format.gen9vgc().calc_cache().calc_cache(None)
+    assert format.cache is None
+
+
+def test_switched_out_aura_is_part_of_the_key():
+    format = Format.gen9vgc().calc_cache()
+    clefable = PokemonBuilder("clefable").build()
+    xerneas = PokemonBuilder("xerneas").ability(Ability.FairyAura).build()
+    # Xerneas stays in game_state.pokemon, so its aura still applies
+    with_aura = format.game(xerneas, flareon()).switch_attacker(clefable)
+    boosted = with_aura.calc("moonblast")
+
+    expected = Format.gen9vgc().game(clefable, flareon()).calc("moonblast")
+    assert format.game(clefable, flareon()).calc("moonblast") == expected
+    assert boosted != expected
@@ -0,0 +1,36 @@
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.damage_result import DamageResult
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from test.testutils import flareon
+
+
+def test_damage_result_matches_calc():
+    format = Format.gen9vgc()
+    game = format.game(PokemonBuilder("rillaboom").build(), flareon())
+    moves = ["stompingtantrum", "woodhammer", "swordsdance"]
+
+    for move, result in zip(moves, game.calc_many_results(moves)):
+        rolls = game.calc(move)
+        assert result == rolls
+        assert result.rolls == rolls
+        assert (result.min, result.max) == (min(rolls), max(rolls))
+
+
+def test_damage_result_helpers():
+    result = DamageResult([80, 85, 90, 95, 100])
+
+    assert result.percent(200) == (40.0, 50.0)
+    assert result.ko_rolls(90) == 3
+    assert result.ko_chance(90) == 0.6
+    assert result.ko_rolls(101) == 0
+    assert result.hits_to_ko(200) == 3
+    assert DamageResult([0]).hits_to_ko(200) is None
+
+
+def test_damage_result_ordering():
+    low = DamageResult([10, 20])
+    high = DamageResult([10, 30])
+
+    assert low.sort_key < high.sort_key
+    assert sorted([high, low], key=lambda r: r.sort_key) == [low, high]
+    assert DamageResult([70000]).max == 70000
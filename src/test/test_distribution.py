@@ -0,0 +1,81 @@
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.model.enums import Ability
+
+
+def test_distribution_sure_crit():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("lapras").build(), PokemonBuilder("garchomp").build()
+    )
+    rolls = game.calc("frostbreath")
+    distribution = game.calc_distribution("frostbreath")
+
+    counts = Counter(rolls)
+    assert distribution.damage.tolist() == sorted(counts)
+    assert distribution.probability.tolist() == pytest.approx(
+        [counts[d] / 16 for d in sorted(counts)]
+    )
+
+
+def test_distribution_crit_chance():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("garchomp").build(), PokemonBuilder("garchomp").build()
+    )
+    rolls = game.calc("earthquake")
+    distribution = game.calc_distribution("earthquake")
+
+    assert distribution.min == rolls[0]
+    assert distribution.probability.sum() == pytest.approx(1)
+    assert distribution.ko_chance(rolls[-1] + 1) == pytest.approx(
+        sum(1 for d in game.calc("earthquake") if d * 1.5 > rolls[-1]) / 16 / 24,
+        abs=1 / 24 / 16,
+    )
+
+    game.defender.ability = Ability.ShellArmor
+    assert distribution.max > game.calc_distribution("earthquake").max == rolls[-1]
+
+
+def test_distribution_multihit():
+    defender = PokemonBuilder("garchomp").build()
+    skill_link = Format.gen9vgc().game(
+        PokemonBuilder("cinccino").ability(Ability.SkillLink).build(), defender
+    )
+    rolls = skill_link.calc("bulletseed")
+    five_hits = skill_link.calc_distribution("bulletseed")
+    assert five_hits.min == rolls[0]
+
+    game = Format.gen9vgc().game(PokemonBuilder("cinccino").build(), defender)
+    distribution = game.calc_distribution("bulletseed")
+    assert distribution.min == pytest.approx(rolls[0] * 2 / 5)
+    # 2 and 3 hits 35% of the time each, 4 and 5 15%
+    assert distribution.mean() == pytest.approx(five_hits.mean() / 5 * 3.1)
+
+
+def test_distribution_parental_bond():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("kangaskhanmega").ability(Ability.ParentalBond).build(),
+        PokemonBuilder("cloyster").ability(Ability.ShellArmor).build(),
+    )
+    rolls = game.calc("doubleedge")
+    distribution = game.calc_distribution("doubleedge")
+
+    # The hits roll independently, so there are totals the paired rolls miss
+    assert (distribution.min, distribution.max) == (rolls[0], rolls[-1])
+    assert len(distribution) > len(set(rolls))
+
+
+def test_distribution_no_damage():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("garchomp").build(),
+        PokemonBuilder("bronzong").ability(Ability.Levitate).build(),
+    )
+    for move in ["earthquake", "swordsdance"]:
+        distribution = game.calc_distribution(move)
+        assert distribution.damage.tolist() == [0]
+        assert distribution.ko_chance(1) == 0
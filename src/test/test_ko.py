@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from pokemon_damage_calculator.calc import ko
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.distribution import DamageDistribution
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.model.enums import Ability, Weather
+
+
+def test_ko_chances_rolls():
+    # Two equally likely rolls of 60 and 100
+    distribution = DamageDistribution(np.array([60, 100]), np.array([0.5, 0.5]))
+
+    assert ko.ko_chances(distribution, 100, turns=3) == pytest.approx([0.5, 1.0, 1.0])
+    assert ko.ko_chances(distribution, 161, turns=3) == pytest.approx([0.0, 0.25, 1.0])
+
+
+def test_ko_chances_accuracy():
+    format = Format.gen9vgc()
+    attacker = PokemonBuilder("garchomp").build()
+    defender = PokemonBuilder("garchomp").build()
+    defender.current_hp = 1
+
+    game = format.game(attacker, defender)
+    # Stone Edge hits 80% of the time, Earthquake always
+    assert game.ko_chances("stoneedge", turns=2) == pytest.approx([0.8, 0.96])
+    assert game.ko_chances("earthquake", turns=2) == pytest.approx([1.0, 1.0])
+
+    game.attacker.ability = Ability.NoGuard
+    assert game.ko_chances("stoneedge", turns=1) == pytest.approx([1.0])
+
+
+def test_ko_chances_weather_accuracy():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("lapras").build(), PokemonBuilder("garchomp").build()
+    )
+    game.defender.current_hp = 1
+
+    assert game.ko_chances("blizzard", turns=1) == pytest.approx([0.7])
+    game.weather = Weather.Snow
+    assert game.ko_chances("blizzard", turns=1) == pytest.approx([1.0])
+
+    game.weather = Weather.HeavyRain
+    assert game.ko_chances("thunder", turns=1) == pytest.approx([1.0])
+    game.weather = Weather.ExtremelyHarshSunlight
+    assert game.ko_chances("thunder", turns=1) == pytest.approx([0.5])
+
+
+def test_ko_chances_accuracy_stages():
+    game = Format.gen9vgc().game(
+        PokemonBuilder("lapras").build(), PokemonBuilder("garchomp").build()
+    )
+    game.defender.current_hp = 1
+
+    game.attacker.boosts.accuracy = 1
+    assert game.ko_chances("blizzard", turns=1) == pytest.approx([0.93])
+    game.defender.boosts.evasion = 2
+    assert game.ko_chances("blizzard", turns=1) == pytest.approx([0.52])
+    # Unaware ignores the target's evasion
+    game.attacker.ability = Ability.Unaware
+    assert game.ko_chances("blizzard", turns=1) == pytest.approx([0.93])
+
+
+def test_ko_chances_many():
+    format = Format.gen9vgc()
+    attacker = PokemonBuilder("garchomp").build()
+    defenders = [
+        PokemonBuilder(species).build()
+        for species in ["garchomp", "flareon", "rillaboom", "flareon", "corviknight"]
+    ]
+
+    chances = ko.ko_chances_many(
+        format, [(attacker, defender) for defender in defenders], "earthquake"
+    )
+
+    for defender, chance in zip(defenders, chances):
+        game = format.game(attacker.copy(), defender.copy())
+        assert chance == pytest.approx(game.ko_chances("earthquake"))
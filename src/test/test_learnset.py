@@ -0,0 +1,36 @@
+from pokemon_damage_calculator.data import get_learnset, get_move
+from pokemon_damage_calculator.data.learnset import Learnset
+
+
+def test_learnset_membership():
+    learnset = get_learnset("rillaboom")
+    assert "woodhammer" in learnset
+    assert "Wood Hammer" in learnset
+    assert get_move("woodhammer") in learnset
+    assert "surf" not in learnset
+    assert "notamove" not in learnset
+    assert len(learnset) == len(list(learnset))
+
+
+def names(learnset: Learnset) -> set[str]:
+    return {move.name for move in learnset}
+
+
+def test_learnset_set_operations():
+    rillaboom = get_learnset("rillaboom")
+    incineroar = get_learnset("incineroar")
+
+    union = rillaboom | incineroar
+    intersection = rillaboom & incineroar
+    assert names(union) == names(rillaboom) | names(incineroar)
+    assert names(intersection) == names(rillaboom) & names(incineroar)
+    assert names(rillaboom - incineroar) == names(rillaboom) - names(incineroar)
+    assert rillaboom.union(incineroar) == union
+    assert rillaboom.intersection(incineroar) == intersection
+
+
+def test_learnset_filter():
+    learnset = get_learnset("rillaboom")
+    strong = learnset.filter(lambda move: move.basePower >= 100)
+    assert list(strong) == [move for move in learnset if move.basePower >= 100]
+    assert Learnset.from_moves(strong) == strong
@@ -0,0 +1,51 @@
+from serde.json import from_json, to_json
+
+from pokemon_damage_calculator.data import get_move
+from pokemon_damage_calculator.model.enums import MoveFlag, Stat
+from pokemon_damage_calculator.model.models import (
+    MoveFeature,
+    StatDistribution,
+    flag_bits,
+    flag_list,
+    flag_mask,
+)
+
+
+def test_stat_distribution_indexing():
+    stats = StatDistribution.manual(hp=1, atk=2, def_=3, spa=4, spd=5, spe=6)
+    assert [stats[stat] for stat in Stat] == [1, 2, 3, 4, 5, 6]
+    stats[Stat.Defence] = 30
+    assert stats.def_ == 30
+    assert not hasattr(stats, "__dict__")
+
+
+def test_stat_distribution_serialization():
+    raw = '{"hp":1,"atk":2,"def":3,"spa":4,"spd":5,"spe":6}'
+    stats = from_json(StatDistribution, raw)
+    assert stats == StatDistribution.manual(1, 2, 3, 4, 5, 6)
+    assert to_json(stats) == raw
+
+
+def test_move_features():
+    earthquake = get_move("earthquake")
+    assert earthquake.has_feature(MoveFeature.GROUND_SHAKING | MoveFeature.SPREAD)
+    assert earthquake.is_normal()
+    assert earthquake.has_flag(MoveFlag.NonSky)
+    assert not earthquake.has_flag(MoveFlag.Contact)
+    assert earthquake.features & flag_mask(MoveFlag.Protect)
+
+    assert get_move("frostbreath").has_feature(MoveFeature.SURE_CRIT)
+    assert get_move("wickedblow").has_feature(MoveFeature.SURE_CRIT)
+    assert not get_move("dreameater").is_normal()
+    assert not get_move("hyperbeam").is_normal()
+    assert not get_move("tackle").has_feature(MoveFeature.SPREAD)
+
+
+def test_move_flag_bits():
+    flags = [MoveFlag.Contact, MoveFlag.Protect, MoveFlag.Punch]
+    assert len({flag.bit for flag in MoveFlag}) == len(MoveFlag)
+    assert sorted(flag_list(flag_bits(flags)), key=flags.index) == flags
+
+    punch = get_move("machpunch")
+    assert isinstance(punch.flags, int)
+    assert set(flag_list(punch.flags)) >= set(flags)
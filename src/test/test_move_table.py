@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pokemon_damage_calculator.data import get_move
+from pokemon_damage_calculator.data.move_table import move_table
+from pokemon_damage_calculator.model.enums import MoveCategory, MoveFlag, PokemonType
+
+
+def test_move_table_query():
+    table = move_table()
+
+    sound = table.query([MoveFlag.Sound])
+    assert get_move("hypervoice") in sound
+    assert sound == [move for move in table.moves if move.has_flag(MoveFlag.Sound)]
+
+    contact_physical = table.query([MoveFlag.Contact], category=MoveCategory.Physical)
+    assert get_move("closecombat") in contact_physical
+    assert get_move("earthquake") not in contact_physical
+    assert all(move.category == MoveCategory.Physical for move in contact_physical)
+
+
+def test_move_table_mask():
+    table = move_table()
+    mask = table.mask(
+        [MoveFlag.Punch], without=[MoveFlag.Contact], type=PokemonType.Fighting
+    )
+    assert len(mask) == len(table)
+    assert all(
+        move.has_flag(MoveFlag.Punch)
+        and not move.has_flag(MoveFlag.Contact)
+        and move.type == PokemonType.Fighting
+        for move in table.select(mask)
+    )
+    assert table.mask().all()
@@ -0,0 +1,48 @@
+import pytest
+
+from pokemon_damage_calculator.data import (
+    get_move,
+    get_species,
+    resolve_moves,
+    search_moves,
+    search_species,
+)
+from pokemon_damage_calculator.data.names import NameIndex
+
+
+def test_name_aliases():
+    index = NameIndex([("kingsshield", "King's Shield"), ("tackle", "Tackle")])
+    assert index.resolve("kingsshield") == 0
+    assert index.resolve("King's Shield") == 0
+    assert index.resolve("king'sshield") == 0
+    assert index.resolve("TACKLE") == 1
+    assert "Tack-le" in index
+    assert "tackles" not in index
+
+
+def test_resolving_spellings_does_not_grow_the_index():
+    index = NameIndex([("tackle", "Tackle")])
+    size = len(index._ids)
+    for spelling in ["TACKLE", "Tack-le", "t a c k l e"]:
+        assert index.resolve(spelling) == 0
+    assert len(index._ids) == size
+    with pytest.raises(KeyError):
+        index.resolve("tackles")
+
+
+def test_resolve_many():
+    assert resolve_moves(["stompingtantrum", "Stomping Tantrum", "surf"]) == [
+        get_move("stompingtantrum"),
+        get_move("stompingtantrum"),
+        get_move("surf"),
+    ]
+
+
+def test_prefix_search():
+    assert search_moves("Thunder", limit=3) == [
+        get_move("thunder"),
+        get_move("thunderbolt"),
+        get_move("thundercage"),
+    ]
+    assert get_species("Farfetch’d-Galar") in search_species("farfetch")
+    assert search_moves("notamoveprefix") == []
@@ -0,0 +1,42 @@
+import pytest
+
+from pokemon_damage_calculator import data
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.data import get_dataset
+from pokemon_damage_calculator.model.enums import PokemonType
+
+
+def test_latest_generation_is_the_plain_tables():
+    assert get_dataset(9).pokedex is data._pokedex
+    assert get_dataset(9).get_species("clefable") is data.get_species("clefable")
+
+
+def test_older_generation_overrides():
+    assert get_dataset(5).get_species("clefable").types == [PokemonType.Normal]
+    assert get_dataset(6).get_species("clefable").types == [PokemonType.Fairy]
+    assert get_dataset(1).get_species("magnemite").types == [PokemonType.Electric]
+
+
+def test_unchanged_records_are_shared():
+    assert get_dataset(5).get_species("rillaboom") is get_dataset(9).get_species(
+        "rillaboom"
+    )
+    assert get_dataset(3).pokedex is get_dataset(4).pokedex
+    assert get_dataset(1).get_nature("adamant") is get_dataset(9).get_nature("adamant")
+
+
+def test_unknown_generation():
+    with pytest.raises(ValueError):
+        get_dataset(10)
+
+
+def test_format_uses_its_generation():
+    gen5, gen9 = Format(5, True), Format(9, True)
+    gen5_damage = gen5.game(gen5.builder("machamp"), gen5.builder("clefable")).calc(
+        "closecombat"
+    )
+    gen9_damage = gen9.game(gen9.builder("machamp"), gen9.builder("clefable")).calc(
+        "closecombat"
+    )
+    # Super effective on Normal-type Clefable, resisted once it is Fairy
+    assert gen5_damage[0] > 3 * gen9_damage[-1]
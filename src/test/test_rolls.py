@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pokemon_damage_calculator.calc import rolls
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.damage_calc import DamageInputs, calc_rolls
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.data import get_learnset
+from pokemon_damage_calculator.model.enums import Ability
+
+
+def _random_inputs(rng: random.Random) -> DamageInputs:
+    return DamageInputs(
+        level=rng.randint(1, 100),
+        power=rng.randint(1, 400),
+        attack=rng.randint(1, 2000),
+        defence=rng.randint(1, 2000),
+        spread=rng.choice([4096, 3072]),
+        weather=rng.choice([0, 2048, 4096, 6144]),
+        crit=rng.choice([4096, 6144]),
+        type_effectiveness=rng.choice([0, 1024, 2048, 4096, 8192, 16384]),
+        stab=rng.choice([4096, 6144, 8192]),
+        burn=rng.choice([2048, 4096]),
+        other=rng.randint(1, 16384),
+        nhits=rng.randint(1, 10),
+        immune=False,
+        parental_bond=rng.random() < 0.2,
+    )
+
+
+def test_numpy_rolls_match_calc_rolls():
+    rng = random.Random(20240516)
+    inputs = [_random_inputs(rng) for _ in range(20000)]
+    expected = [calc_rolls(x) for x in inputs]
+    assert rolls.calc_rolls(rolls.columns(inputs)).tolist() == expected
+
+
+def test_numpy_rolls_format():
+    attacker = PokemonBuilder("kangaskhanmega").ability(Ability.ParentalBond).build()
+    defender = PokemonBuilder("gengar").build()
+    moves = list(get_learnset(attacker.species))
+    expected = Format.gen9vgc().game(attacker, defender).calc_many(moves)
+    game = Format.gen9vgc().numpy_rolls().game(attacker, defender)
+    assert game.calc_many(moves) == expected
+    assert [game.calc(move) for move in moves] == expected
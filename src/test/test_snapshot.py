@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from pokemon_damage_calculator.data import (
+    _load_moves,
+    _parse_learnsets,
+    _parse_natures,
+    snapshot,
+)
+from pokemon_damage_calculator.data.learnset_index import (
+    open_learnset_index,
+    write_learnset_index,
+)
+from pokemon_damage_calculator.data.snapshot import load_snapshot, write_snapshot
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshot")
+    source = tmp_path / "natures.json"
+    source.write_text(Path("data/natures.json").read_text())
+
+    assert load_snapshot(str(source)) is None
+
+    natures = _parse_natures(str(source))
+    write_snapshot(str(source), natures)
+    assert load_snapshot(str(source)) == natures
+
+
+def test_snapshot_stale_after_data_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshot")
+    source = tmp_path / "natures.json"
+    source.write_text(Path("data/natures.json").read_text())
+    write_snapshot(str(source), _parse_natures(str(source)))
+
+    source.write_text(source.read_text().replace("Adamant", "Adamantine"))
+    assert load_snapshot(str(source)) is None
+
+
+def test_learnset_index(tmp_path):
+    learnsets = _parse_learnsets("data/learnsets.json")
+    move_order = list(_load_moves())
+    path = write_learnset_index(
+        learnsets,
+        move_order,
+        "data/learnsets.json",
+        "data/moves.json",
+        tmp_path / "learnsets.idx",
+    )
+
+    index = open_learnset_index(
+        "data/learnsets.json", "data/moves.json", tmp_path / "learnsets.idx"
+    )
+    assert index is not None and len(index) == len(learnsets)
+    for species in ["missingno", "rillaboom", "incineroar"]:
+        assert sorted(move_order[i] for i in index.move_ids(species)) == sorted(
+            learnsets[species]
+        )
+    index.close()
+
+    assert open_learnset_index("data/learnsets.json", "data/natures.json", path) is None
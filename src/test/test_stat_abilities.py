@@ -1,6 +1,13 @@
 from pokemon_damage_calculator.calc.calcbuilder import Format, GameState
 from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
-from pokemon_damage_calculator.model.enums import Ability, Stat, Terrain, Weather
+from pokemon_damage_calculator.model.enums import (
+    Ability,
+    Stat,
+    Status,
+    Terrain,
+    Weather,
+)
+from pokemon_damage_calculator.model.logic import apply_boost
 from test.testutils import flareon
 
 
@@ -133,3 +140,25 @@ def test_huge_power():
         164,
         168,
     ]
+
+
+def test_cached_stats_are_invalidated():
+    venusaur = PokemonBuilder("venusaur").ability(Ability.Chlorophyll).build()
+    game_state = GameState(Format.gen9vgc(), venusaur, flareon())
+    speed = venusaur.stat(Stat.Speed, game_state)
+
+    game_state.weather = Weather.SunnyDay
+    assert venusaur.stat(Stat.Speed, game_state) == 2 * speed
+    game_state.weather = Weather.NONE
+
+    venusaur.ability = Ability.QuickFeet
+    venusaur.status = Status.Burn
+    assert venusaur.stat(Stat.Speed, game_state) == speed * 3 // 2
+    venusaur.status = None
+
+    apply_boost(venusaur, game_state, Stat.Speed, 1, False)
+    assert venusaur.stat(Stat.Speed, game_state) == speed * 3 // 2
+
+    venusaur.evs[Stat.Speed] = 252
+    venusaur.invalidate_stats()
+    assert venusaur.raw_stat(Stat.Speed) == 132
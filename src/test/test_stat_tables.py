@@ -0,0 +1,43 @@
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.calc.stat_tables import EV_STEPS, stat_table
+from pokemon_damage_calculator.data import get_nature
+from pokemon_damage_calculator.model.enums import Stat
+from pokemon_damage_calculator.model.models import StatDistribution
+from pokemon_damage_calculator.model.natures import Nature
+
+
+def test_stat_table_matches_pokemon():
+    for species in ["shuckle", "blissey", "flareon"]:
+        for level in [1, 50, 100]:
+            table = stat_table(species, level)
+            for nature in [Nature.HARDY, Nature.ADAMANT, Nature.TIMID]:
+                for ev in range(0, 256, 3):
+                    for iv in [0, 1, 17, 31]:
+                        pokemon = (
+                            PokemonBuilder(species)
+                            .evs(StatDistribution.flat(ev))
+                            .ivs(StatDistribution.flat(iv))
+                            .nature(nature)
+                            .level(level)
+                            .build()
+                        )
+                        for stat in Stat:
+                            assert table.lookup(
+                                stat, ev, iv, get_nature(nature)
+                            ) == pokemon.raw_stat(stat)
+
+
+def test_stat_table_sweep():
+    table = stat_table("flareon")
+    assert table is stat_table("Flareon")
+    adamant = get_nature(Nature.ADAMANT)
+    speeds = table.sweep(Stat.Speed, adamant)
+    assert len(speeds) == len(EV_STEPS)
+    assert speeds == sorted(speeds)
+    assert speeds[0] == table.lookup(Stat.Speed, 0, 31, adamant)
+
+    target = speeds[10]
+    evs = table.min_evs(Stat.Speed, target, adamant)
+    assert evs is not None and evs <= EV_STEPS[10]
+    assert table.lookup(Stat.Speed, evs, 31, adamant) >= target
+    assert table.min_evs(Stat.Speed, speeds[-1] + 1, adamant) is None
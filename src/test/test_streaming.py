@@ -0,0 +1,37 @@
+import json
+
+from pokemon_damage_calculator.data.streaming import iter_learnsets
+
+
+def test_streaming_matches_json(tmp_path):
+    source = tmp_path / "learnsets.json"
+    source.write_text(
+        json.dumps(
+            {
+                "bulbasaur": {
+                    "learnset": {"tackle": ["9L1"], "vinewhip": ["9L3", "8L3"]},
+                    "eventData": [{"generation": 3, "moves": ["a}", "b]"]}],
+                    "encounters": [{"generation": 1, "level": 5}],
+                },
+                "missingno": {"eventOnly": True, "learnset": {"surf": ["3L1"]}},
+                "pokestarsmeargle": {"learnset": None, "note": 'a, "quoted" }'},
+                "empty": {},
+            },
+            indent=2,
+        )
+    )
+    assert list(iter_learnsets(str(source))) == [
+        ("bulbasaur", ["tackle", "vinewhip"]),
+        ("missingno", ["surf"]),
+        ("pokestarsmeargle", []),
+        ("empty", []),
+    ]
+
+
+def test_streaming_full_file():
+    with open("data/learnsets.json") as f:
+        expected = {
+            species: list(entry.get("learnset") or {})
+            for species, entry in json.load(f).items()
+        }
+    assert dict(iter_learnsets("data/learnsets.json")) == expected
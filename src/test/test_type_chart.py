@@ -0,0 +1,39 @@
+from pokemon_damage_calculator.model import type_chart
+from pokemon_damage_calculator.model.enums import PokemonType
+from pokemon_damage_calculator.model.models import MoveFeature
+
+
+def test_type_chart_lookup():
+    for special in [
+        0,
+        MoveFeature.FREEZE_DRY,
+        MoveFeature.FLYING_PRESS,
+        MoveFeature.THOUSAND_ARROWS,
+    ]:
+        for strong_winds in [False, True]:
+            for move_type in type_chart.TYPES:
+                for first in type_chart.TYPES:
+                    for types in [[first], [first, PokemonType.Flying]]:
+                        assert type_chart.lookup(
+                            move_type, types, special, strong_winds
+                        ) == type_chart.type_effectiveness(
+                            move_type, types, special, strong_winds
+                        )
+
+
+def test_type_chart_variants():
+    water_ground = [PokemonType.Water, PokemonType.Ground]
+    assert type_chart.lookup(PokemonType.Ice, water_ground) == 1
+    assert type_chart.lookup(PokemonType.Ice, water_ground, MoveFeature.FREEZE_DRY) == 4
+
+    dragon_flying = [PokemonType.Dragon, PokemonType.Flying]
+    assert type_chart.lookup(PokemonType.Ice, dragon_flying) == 4
+    assert type_chart.lookup(PokemonType.Ice, dragon_flying, strong_winds=True) == 2
+
+    assert type_chart.lookup(PokemonType.Ground, dragon_flying) == 0
+    assert (
+        type_chart.lookup(
+            PokemonType.Ground, dragon_flying, MoveFeature.THOUSAND_ARROWS
+        )
+        == 1
+    )
@@ -0,0 +1,86 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pokemon_damage_calculator.calc import type_arrays
+from pokemon_damage_calculator.calc.calcbuilder import Format
+from pokemon_damage_calculator.calc.pokemon import PokemonBuilder
+from pokemon_damage_calculator.calc.vectorized import DefenderTable, damage_against
+from pokemon_damage_calculator.data import _species_list
+from pokemon_damage_calculator.model import type_chart
+from pokemon_damage_calculator.model.enums import Ability, Status
+from pokemon_damage_calculator.model.models import StatDistribution
+
+
+def _defenders():
+    defenders = []
+    for i, species in enumerate(_species_list()[::23]):
+        abilities = list(species.abilities.values())
+        pokemon = (
+            PokemonBuilder(species)
+            .ability(abilities[i % len(abilities)])
+            .evs(StatDistribution.flat(4 * (i % 64)))
+            .build()
+        )
+        if i % 5 == 0:
+            pokemon.status = Status.Poison
+        if i % 3 == 0:
+            pokemon.current_hp //= 2
+        defenders.append(pokemon)
+    return defenders
+
+
+@pytest.mark.parametrize(
+    "attacker",
+    [
+        PokemonBuilder("garchomp").ability(Ability.RoughSkin),
+        PokemonBuilder("incineroar").ability(Ability.Intimidate),
+        PokemonBuilder("tyranitar").ability(Ability.SandStream),
+        PokemonBuilder("torkoal").ability(Ability.Drought),
+        PokemonBuilder("kangaskhanmega").ability(Ability.ParentalBond),
+        PokemonBuilder("excadrill").ability(Ability.MoldBreaker),
+        PokemonBuilder("toxapex").ability(Ability.Merciless),
+    ],
+)
+def test_damage_against_matches_calc(attacker):
+    attacker = attacker.build()
+    defenders = _defenders()
+    table = DefenderTable(defenders)
+    moves = [
+        "earthquake",
+        "flamethrower",
+        "hydropump",
+        "closecombat",
+        "moonblast",
+        "brine",
+        "foulplay",
+        "heavyslam",
+        "thousandarrows",
+        "freezedry",
+        "bodypress",
+        "psyshock",
+        "bulletseed",
+        "hypervoice",
+        "venoshock",
+        "protect",
+    ]
+    for move in moves:
+        damage = damage_against(Format.gen9vgc(), attacker, table, move)
+        expected = []
+        for defender in defenders:
+            rolls = Format.gen9vgc().game(attacker.copy(), defender.copy()).calc(move)
+            expected.append(rolls if len(rolls) == 16 else [0] * 16)
+        assert damage.tolist() == expected, move
+
+
+def test_type_arrays_lookup():
+    species = _species_list()[::23]
+    pairs = type_arrays.pair_indices(s.types for s in species)
+    move_types = type_arrays.type_indices(type_chart.TYPES)
+
+    effectiveness = type_arrays.lookup(move_types[:, None], pairs[None, :])
+
+    assert effectiveness.shape == (len(type_chart.TYPES), len(species))
+    for i, move_type in enumerate(type_chart.TYPES):
+        for j, s in enumerate(species):
+            assert effectiveness[i, j] == type_chart.lookup(move_type, s.types)